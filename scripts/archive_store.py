@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Deduplicated run archive for Research Radar.
+Instead of a full JSON snapshot per run, every item is stored once under
+its source+id with first/last-seen dates and per-run field changes, each
+run keeps the list of items it contained, and static link tables are
+stored once per distinct version. Any run's snapshot can be rebuilt,
+less the fields recomputed on every run (RUN_FIELDS).
+
+Usage:
+  python scripts/archive_store.py import docs/data/archive-*.json
+  python scripts/archive_store.py list
+  python scripts/archive_store.py snapshot 2026-03-19 -o snapshot.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "docs" / "data"
+STORE_PATH = DATA_DIR / "archive.json"
+
+ITEM_SOURCES = ["arxiv", "semantic_scholar", "hackernews", "reddit", "bluesky", "faculty_jobs"]
+STORE_VERSION = 1
+
+# Fields recomputed on every run (fetch time, TF-IDF against the run's
+# items, time-decayed relevance); storing them would add an update for
+# nearly every item per run
+RUN_FIELDS = {"ts", "terms", "relevance"}
+
+
+def _digest(value):
+    blob = json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(blob).hexdigest()[:16]
+
+
+def item_key(source, item):
+    """Stable identity of an item: its id, or title+link for sources without one."""
+    if item.get("id"):
+        return f"{source}:{item['id']}"
+    return f"{source}:{_digest([item.get('title', ''), item.get('link', '')])}"
+
+
+def _diff(old, new):
+    """Fields of `new` that differ from `old`; dropped fields are listed under "-"."""
+    changes = {k: v for k, v in new.items() if old.get(k) != v or k not in old}
+    removed = [k for k in old if k not in new]
+    if removed:
+        changes["-"] = removed
+    return changes
+
+
+def _apply(data, changes):
+    data.update({k: v for k, v in changes.items() if k != "-"})
+    for k in changes.get("-", []):
+        data.pop(k, None)
+
+
+class ArchiveStore:
+    """All runs, with each item stored once.
+
+    - items: [{"key", "first_seen", "last_seen", "data", "updates": [[run, changes]]}]
+      `data` is the item as first seen; `updates` hold the fields that
+      changed in later runs.
+    - runs: [{"fetched_at", "meta", "keys", "static", "members": {source: [ordinal]}}]
+      `keys` is the snapshot's top-level key order, `static` names the
+      entry in `static` holding its link tables.
+    - static: {digest: {key: table}}
+    """
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.items = data.get("items", [])
+        self.runs = data.get("runs", [])
+        self.static = data.get("static", {})
+        self._ordinals = {item["key"]: i for i, item in enumerate(self.items)}
+        self._current = {}  # ordinal -> latest data, built on demand
+
+    @classmethod
+    def load(cls, path=STORE_PATH):
+        try:
+            return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return cls()
+
+    def save(self, path=STORE_PATH):
+        """Write the store atomically, one item per line so git deltas stay small."""
+        dump = lambda value: json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        # Streamed line by line: the store grows every run, its text need not sit in memory
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(f'{{\n"version":{STORE_VERSION},\n"static":{dump(self.static)},\n"runs":[\n')
+            for i, run in enumerate(self.runs):
+                f.write((",\n" if i else "") + dump(run))
+            f.write('\n],\n"items":[\n')
+            for i, item in enumerate(self.items):
+                f.write((",\n" if i else "") + dump(item))
+            f.write("\n]}\n")
+        os.replace(tmp, path)
+
+    def ordinal(self, key):
+        """Position of the item stored under `key`, or None."""
+        return self._ordinals.get(key)
+
+    def _latest(self, ordinal):
+        if ordinal not in self._current:
+            item = self.items[ordinal]
+            data = dict(item["data"])
+            for _, changes in item["updates"]:
+                _apply(data, changes)
+            self._current[ordinal] = data
+        return self._current[ordinal]
+
+    def add_run(self, snapshot):
+        """Record a latest.json-shaped snapshot as a new run, without RUN_FIELDS; returns its index."""
+        run_index = len(self.runs)
+        meta = snapshot.get("meta", {})
+        date = (meta.get("fetched_at") or "")[:10]
+        static = {k: v for k, v in snapshot.items() if k != "meta" and k not in ITEM_SOURCES}
+        static_id = _digest(static)
+        self.static.setdefault(static_id, static)
+
+        members = {}
+        for source in ITEM_SOURCES:
+            if source not in snapshot:
+                continue
+            ordinals = members[source] = []
+            used = set()
+            for item in snapshot[source]:
+                item = {k: v for k, v in item.items() if k not in RUN_FIELDS}
+                key = base = item_key(source, item)
+                n = 1
+                while key in used:  # same identity twice in one run
+                    n += 1
+                    key = f"{base}#{n}"
+                used.add(key)
+
+                ordinal = self._ordinals.get(key)
+                if ordinal is None:
+                    ordinal = self._ordinals[key] = len(self.items)
+                    self.items.append({"key": key, "first_seen": date, "last_seen": date,
+                                       "data": item, "updates": []})
+                    self._current[ordinal] = dict(item)
+                else:
+                    entry = self.items[ordinal]
+                    entry["last_seen"] = date
+                    changes = _diff(self._latest(ordinal), item)
+                    if changes:
+                        entry["updates"].append([run_index, changes])
+                        self._current[ordinal] = dict(item)
+                ordinals.append(ordinal)
+
+        self.runs.append({
+            "fetched_at": meta.get("fetched_at", ""),
+            "meta": meta,
+            "keys": list(snapshot),
+            "static": static_id,
+            "members": members,
+        })
+        return run_index
+
+    def item_at(self, ordinal, run_index):
+        """An item's fields as they were in run `run_index`."""
+        item = self.items[ordinal]
+        data = dict(item["data"])
+        for run, changes in item["updates"]:
+            if run > run_index:
+                break
+            _apply(data, changes)
+        return data
+
+    def snapshot(self, run_index):
+        """Rebuild the full latest.json-shaped dict of one run."""
+        run = self.runs[run_index]
+        static = self.static[run["static"]]
+        result = {}
+        for key in run["keys"]:
+            if key == "meta":
+                result[key] = run["meta"]
+            elif key in run["members"]:
+                result[key] = [self.item_at(o, run_index) for o in run["members"][key]]
+            else:
+                result[key] = static[key]
+        return result
+
+    def find_run(self, ref):
+        """Run index for an index, a date (last run that day) or a fetched_at prefix."""
+        if ref.lstrip("-").isdigit():
+            return range(len(self.runs))[int(ref)]
+        matches = [i for i, run in enumerate(self.runs) if run["fetched_at"].startswith(ref)]
+        if not matches:
+            raise KeyError(f"no run matches {ref!r}")
+        return matches[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar archive store")
+    parser.add_argument("--store", default=STORE_PATH, type=Path, help="store file")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="append full JSON snapshots (oldest first)")
+    imp.add_argument("files", nargs="+", type=Path)
+    sub.add_parser("list", help="list recorded runs")
+    snap = sub.add_parser("snapshot", help="rebuild one run's snapshot")
+    snap.add_argument("run", help="run index, date (YYYY-MM-DD) or fetched_at prefix")
+    snap.add_argument("-o", "--output", type=Path, help="write here instead of stdout")
+    args = parser.parse_args(argv)
+
+    store = ArchiveStore.load(args.store)
+
+    if args.command == "import":
+        known = {run["fetched_at"] for run in store.runs}
+        snapshots = [json.loads(f.read_text(encoding="utf-8")) for f in args.files]
+        snapshots.sort(key=lambda s: s.get("meta", {}).get("fetched_at", ""))
+        for snapshot in snapshots:
+            if snapshot.get("meta", {}).get("fetched_at", "") in known:
+                continue
+            store.add_run(snapshot)
+        store.save(args.store)
+        print(f"✓ {len(store.runs)} runs, {len(store.items)} unique items in {args.store}")
+
+    elif args.command == "list":
+        for i, run in enumerate(store.runs):
+            counts = sum(len(m) for m in run["members"].values())
+            print(f"{i:4d}  {run['fetched_at']}  {counts} items")
+
+    elif args.command == "snapshot":
+        text = json.dumps(store.snapshot(store.find_run(args.run)), indent=2, ensure_ascii=False)
+        if args.output:
+            args.output.write_text(text, encoding="utf-8")
+        else:
+            sys.stdout.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
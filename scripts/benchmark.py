@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks for the Research Radar fetch pipeline.
+`parse` times the Atom, JSON and drafty HTML parsers on synthetic
+payloads (items/s, MB/s, peak traced memory). `run` times a whole
+fetch_all run answered from fixtures, in process or through the
+stand-in server with injected latency and 429s, and reports wall time,
+request count and peak RSS. No network is used; unrecorded requests get
+synthetic answers from standin_server.
+
+Usage:
+  python scripts/benchmark.py parse --items 2000
+  python scripts/benchmark.py run [--fixtures DIR]
+  python scripts/benchmark.py run --standin --latency 0.05 --rate-429 0.05
+  python scripts/benchmark.py all --json bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import http_client
+from standin_server import (SYNTHETIC_ITEMS, StandinServer, make_store, synthetic_arxiv,
+                            synthetic_drafty, synthetic_hn, synthetic_reddit)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _max_rss_mb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+# ─── Parse throughput ────────────────────────────────────────────────────────
+
+def _parse_cases(items):
+    import fetch_all
+    from fetch_faculty_jobs import parse_csrankings_jobs
+    from html_tables import chunked
+
+    rng = random.Random(0)
+    atom, _ = synthetic_arxiv({"search_query": ['all:"llm"'], "max_results": [str(items)]}, rng, items)
+    hn = json.dumps(synthetic_hn({"query": ["llm"], "hitsPerPage": [str(items)]}, rng, items))
+    reddit = json.dumps(synthetic_reddit("/r/MachineLearning/new.json", {"limit": [str(items)]}, rng, items))
+    html, _ = synthetic_drafty(rng, items)
+
+    return {
+        "atom": (atom, lambda: [fetch_all.arxiv_record(e, "llm") for e in fetch_all.parse_arxiv_feed(atom)]),
+        "json_hn": (hn, lambda: json.loads(hn)["hits"]),
+        "json_reddit": (reddit, lambda: [c["data"] for c in json.loads(reddit)["data"]["children"]]),
+        "drafty_html": (html, lambda: parse_csrankings_jobs(chunked(html))),
+    }
+
+
+def bench_parse(items=2000, repeat=5):
+    """Best-of-`repeat` throughput of each parser over `items`-entry payloads."""
+    results = {}
+    for name, (payload, parse) in _parse_cases(items).items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parsed = parse()
+            best = min(best, time.perf_counter() - start)
+        tracemalloc.start()
+        parse()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        size = len(payload.encode("utf-8"))
+        results[name] = {
+            "items": len(parsed),
+            "bytes": size,
+            "seconds": round(best, 4),
+            "items_per_s": round(len(parsed) / best),
+            "mb_per_s": round(size / best / 1e6, 1),
+            "peak_mb": round(peak / 1e6, 2),
+        }
+    return results
+
+
+# ─── End-to-end run ──────────────────────────────────────────────────────────
+
+def bench_run(fixtures=None, items=SYNTHETIC_ITEMS, standin=False, latency=0.0, rate_429=0.0,
+              throttle=False, serial=False):
+    """Time one full fetch_all run answered from fixtures (or synthetic payloads)."""
+    import fetch_all
+
+    store = make_store(fixtures, items)
+    server = None
+    saved_rates = dict(http_client.HOST_RATES)
+    if not throttle:
+        http_client.HOST_RATES.clear()
+        http_client._buckets.clear()
+    if standin:
+        server = StandinServer(store, latency=latency, rate_429=rate_429)
+        http_client.route_to_standin(server.start())
+    else:
+        http_client.FIXTURES = store
+
+    try:
+        with tempfile.TemporaryDirectory() as data_dir:
+            argv = ["--full", "--no-cache", "--data-dir", data_dir]
+            if serial:
+                argv.append("--serial")
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                fetch_all.main(argv)
+            wall = time.perf_counter() - start
+            report = json.loads((Path(data_dir) / fetch_all.REPORT_PATH).read_text(encoding="utf-8"))
+    finally:
+        http_client.FIXTURES = None
+        http_client.route_to_standin(None)
+        http_client.HOST_RATES.update(saved_rates)
+        http_client._buckets.clear()
+        if server:
+            server.stop()
+
+    return {
+        "mode": "standin" if standin else "replay",
+        "wall": round(wall, 3),
+        "requests": sum(s["requests"] for s in report["sources"].values()),
+        "sources": {name: {"wall": s.get("wall"), "items": s.get("items"), "requests": s["requests"]}
+                    for name, s in report["sources"].items()},
+        "max_rss_mb": _max_rss_mb(),
+        **({"throttled": server.stats["throttled"]} if server else {}),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar offline benchmarks")
+    parser.add_argument("suite", choices=["parse", "run", "all"])
+    parser.add_argument("--items", type=int, help="items per payload (parse: 2000, run: 50)")
+    parser.add_argument("--repeat", type=int, default=5, help="parse: best of this many runs")
+    parser.add_argument("--fixtures", help="run: recorded fixtures (fetch_all.py --record DIR)")
+    parser.add_argument("--standin", action="store_true", help="run: go through the stand-in server")
+    parser.add_argument("--latency", type=float, default=0.0, help="stand-in: seconds per answer")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="stand-in: share answered 429")
+    parser.add_argument("--throttle", action="store_true", help="run: keep the real per-host rate limits")
+    parser.add_argument("--serial", action="store_true", help="run: fetch sources one at a time")
+    parser.add_argument("--json", type=Path, help="also write the results here")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.suite in ("parse", "all"):
+        results["parse"] = bench_parse(args.items or 2000, args.repeat)
+        print("⏱  Parse throughput")
+        for name, r in results["parse"].items():
+            print(f"   {name:<12} {r['items_per_s']:>9,} items/s  {r['mb_per_s']:>6} MB/s"
+                  f"  peak {r['peak_mb']} MB  ({r['items']} items, {r['bytes']:,} bytes)")
+    if args.suite in ("run", "all"):
+        results["run"] = bench_run(args.fixtures, args.items or SYNTHETIC_ITEMS, args.standin,
+                                   args.latency, args.rate_429, args.throttle, args.serial)
+        r = results["run"]
+        print(f"⏱  End-to-end ({r['mode']}): {r['wall']}s, {r['requests']} requests, peak RSS {r['max_rss_mb']} MB")
+        for name, s in r["sources"].items():
+            print(f"   {name:<18} {s['wall'] or 0:6.2f}s  {s['items']} items  {s['requests']} requests")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
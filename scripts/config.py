@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Scan configuration for Research Radar, read from the '自动扫描配置'
+section of information-source.md.
+The markdown is parsed and validated once per content change: the result
+is kept as a JSON snapshot in .cache/config.json keyed by the file's
+hash, so later runs only hash the file and load the snapshot. Nothing is
+read until `get_config()` is first called.
+
+Usage:
+  python scripts/config.py          # compile, validate, print a summary
+  python scripts/config.py --force  # ignore the snapshot
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONFIG_MD = PROJECT_ROOT / "information-source.md"
+SNAPSHOT_PATH = PROJECT_ROOT / ".cache" / "config.json"
+
+# Bump when parsing or validation changes, so old snapshots are recompiled
+CONFIG_VERSION = 1
+SECTION_MARKER = "## 九、Research Radar 自动扫描配置"
+
+DEFAULTS = {
+    "arxiv_categories": ["cs.HC", "cs.AI", "cs.CL", "cs.SE"],
+    "arxiv_keywords": ["human-AI collaboration", "LLM agent", "AI agent"],
+    "s2_keywords": ["human-AI collaboration LLM"],
+    "tracked_authors": {},
+    "hn_keywords": ["AI agent", "LLM agent", "human-AI"],
+    "reddit_subreddits": ["MachineLearning", "artificial", "LocalLLaMA"],
+    "reddit_keywords": ["agent", "human-AI", "agentic"],
+    "days_lookback": 7,
+    "bluesky_keywords": ["human-AI collaboration", "coding agents", "LLM agent", "HCI research"],
+    "bluesky_handles": ["janchristianblaise.bsky.social", "hci.bsky.social"],
+    "blogs": [],
+    "newsletters": [],
+    "researchers": [],
+    "seminars": [],
+    "podcasts": [],
+    "conferences": [],
+    "opportunities": [],
+}
+
+# Static link directories: config key -> ### heading
+LINK_TABLES = {
+    "blogs": "公司/实验室博客",
+    "newsletters": "Newsletter / 个人博客",
+    "researchers": "推荐关注",
+    "seminars": "Seminars/Talks",
+    "podcasts": "播客",
+    "conferences": "会议/Workshop",
+    "opportunities": "Career/Grant Opportunities",
+}
+
+# e.g. cs.HC, stat.ML, q-bio.NC, physics.soc-ph, econ
+ARXIV_CATEGORY_RE = re.compile(r"^[a-z]+(-[a-z]+)?(\.[A-Za-z]+(-[a-z]+)?)?$")
+BLUESKY_HANDLE_RE = re.compile(r"^[A-Za-z0-9-]+(\.[A-Za-z0-9-]+)+$")
+SUBREDDIT_RE = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+class ConfigError(ValueError):
+    """The config section parsed, but some entries are malformed."""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("invalid scan configuration in information-source.md:\n  - "
+                         + "\n  - ".join(problems))
+
+
+# ─── Parsing ─────────────────────────────────────────────────────────────────
+
+def split_sections(section):
+    """Map each '### heading' to its body, up to the next ## or ### heading (first one wins)."""
+    sections = {}
+    heading, body = None, []
+    for line in section.splitlines():
+        if line.startswith("##"):
+            if heading is not None:
+                sections.setdefault(heading, "\n".join(body).strip())
+            heading = line[4:].strip() if line.startswith("### ") else None
+            body = []
+        elif heading is not None:
+            body.append(line)
+    if heading is not None:
+        sections.setdefault(heading, "\n".join(body).strip())
+    return sections
+
+
+def parse_bullet_list(block):
+    """Parse '- item' lines into a list."""
+    return [line.lstrip("- ").strip() for line in block.splitlines()
+            if line.strip().startswith("- ")]
+
+
+def parse_comma_list(block):
+    """Parse comma-separated values."""
+    return [item.strip() for item in block.split(",") if item.strip()]
+
+
+def parse_link_table(block):
+    """Parse a markdown table into a list of dicts."""
+    items = []
+    headers = None
+    for line in block.splitlines():
+        line = line.strip()
+        if not line.startswith("|"):
+            continue
+        cells = [c.strip() for c in line.split("|")[1:-1]]
+        if not cells:
+            continue
+        if all(set(c) <= set("-: ") for c in cells):
+            continue
+        if headers is None:
+            headers = cells
+        else:
+            row = {}
+            for i, h in enumerate(headers):
+                if i < len(cells):
+                    row[h] = cells[i]
+            items.append(row)
+    return items
+
+
+def parse_config(text):
+    """Build the config dict from the markdown text (defaults for missing subsections)."""
+    config = json.loads(json.dumps(DEFAULTS))
+    idx = text.find(SECTION_MARKER)
+    if idx == -1:
+        print("  ⚠ Config section not found in markdown, using defaults")
+        return config
+    sections = split_sections(text[idx:])
+
+    lists = {
+        "arxiv_categories": ("arXiv 分类", parse_comma_list),
+        "arxiv_keywords": ("arXiv 关键词", parse_bullet_list),
+        "s2_keywords": ("Semantic Scholar 关键词", parse_bullet_list),
+        "hn_keywords": ("HackerNews 关键词", parse_bullet_list),
+        "reddit_keywords": ("Reddit 过滤关键词", parse_comma_list),
+        "bluesky_keywords": ("Bluesky 关键词", parse_bullet_list),
+        "bluesky_handles": ("Bluesky 跟踪账号", parse_comma_list),
+    }
+    for key, (heading, parse) in lists.items():
+        raw = sections.get(heading)
+        if raw:
+            config[key] = parse(raw)
+
+    raw = sections.get("Reddit 子版块")
+    if raw:
+        config["reddit_subreddits"] = [s.removeprefix("r/").strip() for s in parse_comma_list(raw)]
+
+    # Table: | Name | ID |; IDs are checked by validate_config
+    raw = sections.get("Semantic Scholar 跟踪作者")
+    if raw:
+        authors = {}
+        for row in parse_link_table(raw):
+            values = list(row.values())
+            if len(values) >= 2 and values[0]:
+                authors[values[0]] = values[1]
+        if authors:
+            config["tracked_authors"] = authors
+
+    raw = sections.get("时间窗口")
+    if raw:
+        try:
+            config["days_lookback"] = int(raw.splitlines()[0].strip())
+        except ValueError:
+            config["days_lookback"] = raw.splitlines()[0].strip()
+
+    for key, heading in LINK_TABLES.items():
+        config[key] = parse_link_table(sections.get(heading, ""))
+    return config
+
+
+def validate_config(config):
+    """Raise ConfigError listing every malformed entry."""
+    problems = []
+    for category in config["arxiv_categories"]:
+        if not ARXIV_CATEGORY_RE.match(category):
+            problems.append(f"arXiv 分类: {category!r} is not an arXiv category (e.g. cs.HC)")
+    for name, author_id in config["tracked_authors"].items():
+        if not author_id.isdigit():
+            problems.append(f"Semantic Scholar 跟踪作者: {name!r} has non-numeric ID {author_id!r}")
+    for subreddit in config["reddit_subreddits"]:
+        if not SUBREDDIT_RE.match(subreddit):
+            problems.append(f"Reddit 子版块: {subreddit!r} is not a subreddit name")
+    for handle in config["bluesky_handles"]:
+        if not BLUESKY_HANDLE_RE.match(handle):
+            problems.append(f"Bluesky 跟踪账号: {handle!r} is not a handle (e.g. name.bsky.social)")
+    if not isinstance(config["days_lookback"], int) or config["days_lookback"] < 1:
+        problems.append(f"时间窗口: {config['days_lookback']!r} is not a positive number of days")
+    for key in ("arxiv_keywords", "s2_keywords", "hn_keywords", "reddit_keywords", "bluesky_keywords"):
+        if any(not keyword for keyword in config[key]):
+            problems.append(f"{key}: empty keyword")
+    if problems:
+        raise ConfigError(problems)
+    return config
+
+
+# ─── Snapshot ────────────────────────────────────────────────────────────────
+
+def _hash(raw):
+    return hashlib.sha256(f"v{CONFIG_VERSION}\n".encode() + raw).hexdigest()
+
+
+def _read_snapshot(path, digest):
+    try:
+        snapshot = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return snapshot.get("config") if snapshot.get("hash") == digest else None
+
+
+def _write_snapshot(path, digest, config):
+    path = Path(path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"hash": digest, "config": config}, ensure_ascii=False),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:  # read-only checkout: still usable, just not cached
+        print(f"  ⚠ Could not save config snapshot: {e}")
+
+
+def load_config(path=CONFIG_MD, snapshot_path=SNAPSHOT_PATH, force=False):
+    """Return the validated config, from the snapshot if the markdown is unchanged."""
+    try:
+        raw = Path(path).read_bytes()
+    except FileNotFoundError:
+        print(f"  ⚠ Config file not found ({path}), using defaults")
+        return json.loads(json.dumps(DEFAULTS))
+
+    digest = _hash(raw)
+    config = None if force or snapshot_path is None else _read_snapshot(snapshot_path, digest)
+    if config is None:
+        config = validate_config(parse_config(raw.decode("utf-8")))
+        if snapshot_path is not None:
+            _write_snapshot(snapshot_path, digest, config)
+    return config
+
+
+_config = None
+_config_lock = threading.Lock()
+
+
+def get_config():
+    """The process-wide config, loaded on first use."""
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                _config = load_config()
+    return _config
+
+
+def use_config(config):
+    """Make `config` the process-wide config (multi-profile runs fetch under their union)."""
+    global _config
+    with _config_lock:
+        _config = config
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile and check the Research Radar scan config")
+    parser.add_argument("--source", default=CONFIG_MD, type=Path, help="markdown file")
+    parser.add_argument("--force", action="store_true", help="recompile even if the snapshot is current")
+    args = parser.parse_args(argv)
+
+    try:
+        config = load_config(args.source, force=args.force)
+    except ConfigError as e:
+        print(f"✗ {e}")
+        raise SystemExit(1)
+    print(f"✓ Config OK: {len(config['arxiv_keywords'])} arXiv / {len(config['s2_keywords'])} S2 / "
+          f"{len(config['hn_keywords'])} HN keywords, {len(config['tracked_authors'])} authors, "
+          f"{len(config['reddit_subreddits'])} subreddits, {len(config['bluesky_handles'])} Bluesky handles")
+
+
+if __name__ == "__main__":
+    main()
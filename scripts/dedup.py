@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Cross-source deduplication for Research Radar.
+Runs once after every fetcher has finished: papers that share an arXiv
+ID, a DOI or a normalized title, or whose titles are near-identical by
+MinHash/LSH, are merged into a single record. Titles only decide between
+records that cannot be told apart by ID: two papers with different arXiv
+IDs or DOIs are never merged, directly or through a third record. Work
+stays linear in the number of items: every item is hashed into a few
+buckets and only bucket-mates are compared.
+"""
+
+import hashlib
+import random
+import re
+import unicodedata
+
+PAPER_SOURCES = ["arxiv", "semantic_scholar"]
+
+SHINGLE_SIZE = 4          # characters per title shingle
+MINHASH_BANDS = 8
+MINHASH_ROWS = 4          # 8 bands x 4 rows = 32 hash functions
+NEAR_DUP_JACCARD = 0.8    # shingle overlap that counts as the same title
+MAX_BUCKET_CHECKS = 8     # bucket-mates compared before giving up
+
+# Each hash function is the shingle's 64-bit digest XOR-ed with a fixed mask
+_MASKS = [random.Random(i).getrandbits(64) for i in range(MINHASH_BANDS * MINHASH_ROWS)]
+_ARXIV_VERSION_RE = re.compile(r"v\d+$")
+_ARXIV_LINK_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/([^\s?#]+?)(?:\.pdf)?$")
+
+
+def normalize_title(title):
+    """Lower-case ASCII-folded title with punctuation and spacing collapsed."""
+    text = unicodedata.normalize("NFKD", title or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).lower()
+    return " ".join(re.findall(r"[^\W_]+", text))
+
+
+def normalize_arxiv_id(value):
+    """'2403.12345v2', 'arXiv:2403.12345' or an arxiv.org link -> '2403.12345'."""
+    if not value:
+        return ""
+    value = value.strip()
+    match = _ARXIV_LINK_RE.search(value)
+    if match:
+        value = match.group(1)
+    if value.lower().startswith("arxiv:"):
+        value = value[6:]
+    return _ARXIV_VERSION_RE.sub("", value).lower()
+
+
+def paper_ids(item):
+    """Exact identifiers of a paper record: ("arxiv", id) and ("doi", doi)."""
+    ids = []
+    if item.get("source") == "arxiv":
+        arxiv_id = normalize_arxiv_id(item.get("id"))
+    else:
+        arxiv_id = normalize_arxiv_id(item.get("arxiv_id")) or normalize_arxiv_id(item.get("link"))
+    if arxiv_id:
+        ids.append(("arxiv", arxiv_id))
+    if item.get("doi"):
+        ids.append(("doi", item["doi"].strip().lower()))
+    return ids
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """Set of overlapping `size`-character substrings of `text`."""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def minhash(shingle_set):
+    """MinHash signature: the minimum of each hash function over the shingles."""
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingle_set
+    ]
+    return [min(map(mask.__xor__, hashes)) for mask in _MASKS]
+
+
+def lsh_keys(signature):
+    """One bucket key per band; titles sharing any band become candidates."""
+    return [
+        (band, tuple(signature[band * MINHASH_ROWS:(band + 1) * MINHASH_ROWS]))
+        for band in range(MINHASH_BANDS)
+    ]
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+class _UnionFind:
+    """Union-find that tracks each cluster's exact IDs ({kind: value}) at its root."""
+
+    def __init__(self, ids):
+        self.parent = list(range(len(ids)))
+        self.ids = [dict(item_ids) for item_ids in ids]
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b, by_title=False):
+        """Merge the clusters of `a` and `b` unless their IDs rule it out; True if merged.
+
+        No two clusters whose arXiv IDs or DOIs differ are merged. A title
+        match is also refused when both carry an ID of the same kind: that
+        ID, not the title, says whether they are the same paper.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return True
+        shared = self.ids[a].keys() & self.ids[b].keys()
+        if (by_title and shared) or any(self.ids[a][kind] != self.ids[b][kind] for kind in shared):
+            return False
+        # The earlier item stays the root, so it becomes the merged record
+        root, child = min(a, b), max(a, b)
+        self.parent[child] = root
+        self.ids[root].update(self.ids[child])
+        return True
+
+
+def find_duplicates(items):
+    """Group indexes of `items` that describe the same paper.
+
+    Returns a list of clusters (sorted index lists), one per paper.
+    """
+    ids = [paper_ids(item) for item in items]
+    uf = _UnionFind(ids)
+    exact = {}
+    buckets = {}
+    shingle_sets = []
+
+    for i, item in enumerate(items):
+        title = normalize_title(item.get("title"))
+        for key in ids[i] + ([("title", title)] if title else []):
+            if key in exact:
+                uf.union(exact[key], i, by_title=key[0] == "title")
+            else:
+                exact[key] = i
+
+        shingle_set = shingles(title)
+        shingle_sets.append(shingle_set)
+        if not shingle_set:
+            continue
+        for key in lsh_keys(minhash(shingle_set)):
+            mates = buckets.setdefault(key, [])
+            for j in mates[:MAX_BUCKET_CHECKS]:
+                if uf.find(i) != uf.find(j) and jaccard(shingle_set, shingle_sets[j]) >= NEAR_DUP_JACCARD:
+                    uf.union(i, j, by_title=True)
+            mates.append(i)
+
+    clusters = {}
+    for i in range(len(items)):
+        clusters.setdefault(uf.find(i), []).append(i)
+    return list(clusters.values())
+
+
+def merge_records(records):
+    """Merge duplicates into the first record.
+
+    Missing fields are filled from the others, and each other record is
+    listed under `also_seen` as {source, id, link}.
+    """
+    merged = dict(records[0])
+    also_seen = list(merged.get("also_seen", []))
+    for other in records[1:]:
+        for key, value in other.items():
+            if key in ("also_seen", "source", "id", "link", "matched_keyword"):
+                continue
+            if value and not merged.get(key):
+                merged[key] = value
+        if (other.get("citations") or 0) > (merged.get("citations") or 0):
+            merged["citations"] = other["citations"]
+        also_seen.append({"source": other.get("source"), "id": other.get("id"), "link": other.get("link")})
+        also_seen.extend(other.get("also_seen", []))
+    # Records merged on an earlier run come back with their own `also_seen`
+    unique = {}
+    for entry in also_seen:
+        if (entry["source"], entry["id"]) != (merged.get("source"), merged.get("id")):
+            unique.setdefault((entry["source"], entry["id"]), entry)
+    if unique:
+        merged["also_seen"] = list(unique.values())
+    return merged
+
+
+def dedupe_papers(all_data, sources=PAPER_SOURCES):
+    """Merge duplicate papers across `sources` in place; returns how many were folded.
+
+    A merged record stays in the section of its earliest member (sources
+    in the order given), and the other members are dropped.
+    """
+    items = [item for source in sources for item in all_data.get(source) or []]
+    merged = {}
+    dropped = set()
+    for cluster in find_duplicates(items):
+        if len(cluster) > 1:
+            merged[cluster[0]] = merge_records([items[i] for i in cluster])
+            dropped.update(cluster[1:])
+
+    offset = 0
+    for source in sources:
+        section = all_data.get(source) or []
+        all_data[source] = [
+            merged.get(offset + i, item)
+            for i, item in enumerate(section)
+            if offset + i not in dropped
+        ]
+        offset += len(section)
+    return len(dropped)
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Post-fetch enrichment for Research Radar.
+For every paper and discussion, over the full title and abstract (not
+the 500-character summary):
+  - keywords: every configured keyword the text contains
+  - terms:    the top TF-IDF terms, against this run's items
+  - topic:    the configured keyword the text covers best (see topic_labels)
+Term counts and topics are computed in a process pool, sharded by item,
+and cached in <data dir>/.cache/enrich.json under each item's key and
+content hash, so unchanged items are never reprocessed. Only the IDF weighting,
+which depends on the whole run, is redone each time.
+"""
+
+import hashlib
+import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from archive_store import item_key
+from keyword_matcher import KeywordMatcher
+from ranking import KEYWORD_LISTS, RANKED_SOURCES
+from search_index import STOPWORDS, tokenize
+
+# Bump when tokenizing, matching or topic assignment change, so cached results are recomputed
+ENRICH_VERSION = 2
+TERMS_PER_ITEM = 5
+MIN_POOL_ITEMS = 200    # fewer uncached items than this are cheaper to do in process
+SHARDS_PER_WORKER = 4
+
+# Words too common in abstracts and posts to be key terms
+TERM_STOPWORDS = STOPWORDS | {
+    "also", "but", "can", "not", "our", "their", "these", "they", "us", "how", "what", "when",
+    "more", "most", "such", "than", "then", "there", "into", "about", "over", "using", "use",
+    "used", "based", "new", "paper", "propose", "proposed", "present", "show", "shows",
+    "results", "result", "approach", "method", "methods", "work", "study", "find", "findings",
+    "may", "one", "two", "will", "while", "well", "both", "however", "via", "across", "through",
+    "http", "https", "www", "com",
+}
+
+DEFAULT_TOPIC = "Other"
+
+
+def item_text(item):
+    """Full title and abstract (fetchers pass the untruncated one as `abstract`)."""
+    return item.get("title") or "", item.get("abstract") or item.get("summary") or ""
+
+
+def content_hash(item):
+    """Hash of the stored title and summary; items carried over from latest.json
+    lack `abstract`, so it is left out to keep their cache entries valid."""
+    blob = f"{ENRICH_VERSION}\n{item.get('title') or ''}\n{item.get('summary') or ''}"
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def topic_labels(keywords):
+    """{label: {token: weight}} with every configured keyword as a topic label.
+
+    Labels come from the profile's own keyword lists rather than a fixed
+    taxonomy, so any profile gets topics in its own terms. A word's weight
+    is 1 / the number of keywords containing it, so shared words like
+    "AI" or "LLM" count for little.
+    """
+    tokens = {kw: {t for t in tokenize(kw) if t not in TERM_STOPWORDS} for kw in keywords}
+    df = Counter(t for words in tokens.values() for t in words)
+    return {kw: {t: 1 / df[t] for t in words} for kw, words in tokens.items() if words}
+
+
+def assign_topic(counts, topics):
+    """The label all of whose words occur in `counts` (plurals count), with the
+    highest weighted count; the first listed wins ties, DEFAULT_TOPIC if none fits."""
+    best, best_score = DEFAULT_TOPIC, 0.0
+    for label, weights in topics.items():
+        hits = {t: counts.get(t, 0) + counts.get(t + "s", 0) for t in weights}
+        if not all(hits.values()):
+            continue
+        score = sum(weights[t] * n for t, n in hits.items())
+        if score > best_score:
+            best, best_score = label, score
+    return best
+
+
+# ─── Per-item work (runs in worker processes) ────────────────────────────────
+
+_matcher = None
+_topics = None
+
+
+def _init_worker(keywords):
+    global _matcher, _topics
+    _matcher = KeywordMatcher(keywords)
+    _topics = topic_labels(keywords)
+
+
+def analyze(title, text):
+    """Keywords, term counts and topic of one item; needs `_init_worker` first."""
+    full = f"{title}\n{text}"
+    counts = Counter(t for t in tokenize(full) if t not in TERM_STOPWORDS and not t.isdigit())
+    # Title words count double
+    counts.update(t for t in tokenize(title) if t in counts)
+    return {"keywords": _matcher.matched(full), "tf": dict(counts), "topic": assign_topic(counts, _topics)}
+
+
+def _analyze_shard(shard):
+    return [(key, digest, analyze(title, text)) for key, digest, title, text in shard]
+
+
+def _run_shards(work, keywords, workers):
+    if len(work) < MIN_POOL_ITEMS or workers < 2:
+        _init_worker(keywords)
+        return _analyze_shard(work)
+    size = max(1, math.ceil(len(work) / (workers * SHARDS_PER_WORKER)))
+    shards = [work[i:i + size] for i in range(0, len(work), size)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(keywords,)) as pool:
+        return [row for rows in pool.map(_analyze_shard, shards) for row in rows]
+
+
+# ─── Cache ───────────────────────────────────────────────────────────────────
+
+def _keywords_hash(keywords):
+    return hashlib.sha1("\n".join(keywords).encode("utf-8")).hexdigest()[:16]
+
+
+def cache_for(data_dir):
+    """The enrich cache kept with a data directory (each profile, temp run, ... has its own)."""
+    return Path(data_dir) / ".cache" / "enrich.json"
+
+
+def load_cache(path, keywords):
+    """{item key: [content hash, analysis]}, empty if the keyword list changed."""
+    try:
+        cache = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+    if cache.get("version") != ENRICH_VERSION or cache.get("keywords") != _keywords_hash(keywords):
+        return {}
+    return cache.get("items", {})
+
+
+def save_cache(path, keywords, items):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps({"version": ENRICH_VERSION, "keywords": _keywords_hash(keywords),
+                               "items": items}, ensure_ascii=False, separators=(",", ":")),
+                   encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# ─── Stage ───────────────────────────────────────────────────────────────────
+
+def tfidf_terms(analyses, k=TERMS_PER_ITEM):
+    """Top-k TF-IDF terms of each analysis, with document frequencies taken across all of them."""
+    df = Counter(term for a in analyses for term in a["tf"])
+    n = len(analyses)
+    idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+    terms = []
+    for a in analyses:
+        weighted = sorted(a["tf"].items(), key=lambda kv: (-kv[1] * idf[kv[0]], kv[0]))
+        terms.append([term for term, _ in weighted[:k]])
+    return terms
+
+
+def enrich_items(all_data, cfg, cache_path=None, workers=None):
+    """Add `keywords`, `terms` and `topic` to papers and discussions.
+
+    Drops the fetchers' full `abstract` afterwards. Returns (items enriched,
+    items answered from the cache).
+    """
+    keywords = list(dict.fromkeys(kw for key in KEYWORD_LISTS for kw in cfg.get(key, [])))
+    cache = load_cache(cache_path, keywords) if cache_path else {}
+    items, keys, work, analyses = [], [], [], {}
+    for source in RANKED_SOURCES:
+        for item in all_data.get(source) or []:
+            key = item_key(source, item)
+            digest = content_hash(item)
+            cached = cache.get(key)
+            if cached and cached[0] == digest:
+                analyses[key] = cached
+            else:
+                work.append((key, digest, *item_text(item)))
+            items.append(item)
+            keys.append(key)
+
+    for key, digest, analysis in _run_shards(work, keywords, workers or os.cpu_count() or 1):
+        analyses[key] = [digest, analysis]
+
+    per_item = [analyses[key][1] for key in keys]
+    for item, analysis, terms in zip(items, per_item, tfidf_terms(per_item)):
+        item.pop("abstract", None)
+        item["keywords"] = analysis["keywords"]
+        item["terms"] = terms
+        item["topic"] = analysis["topic"]
+
+    if cache_path:
+        # Only this run's items are kept, so the cache never outgrows the data
+        save_cache(cache_path, keywords, {key: analyses[key] for key in keys})
+    return len(items), len(items) - len(work)
@@ -5,258 +5,322 @@ Fetches from: arXiv, Semantic Scholar, HackerNews, Reddit
 Outputs: JSON data files for dashboard consumption
 """
 
+import argparse
+import contextvars
+import io
 import json
 import os
-import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-import urllib.request
 import urllib.parse
 import xml.etree.ElementTree as ET
 
+import http_client
+import telemetry
+from config import get_config, use_config
+from dedup import dedupe_papers
+from enrich import cache_for, enrich_items
+from keyword_matcher import compile_keywords
+from output import write_json_atomic, write_outputs
+from profiles import load_profiles, merge_windows, read_json, select_items, union_config
+from ranking import score_items
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "docs" / "data"
-DATA_DIR.mkdir(parents=True, exist_ok=True)
-CONFIG_MD = PROJECT_ROOT / "information-source.md"
-
-
-# ─── Configuration (loaded from information-source.md) ───────────────────────
-
-def load_config():
-    """Parse the '自动扫描配置' section from information-source.md."""
-    config = {
-        "arxiv_categories": ["cs.HC", "cs.AI", "cs.CL", "cs.SE"],
-        "arxiv_keywords": ["human-AI collaboration", "LLM agent", "AI agent"],
-        "s2_keywords": ["human-AI collaboration LLM"],
-        "tracked_authors": {},
-        "hn_keywords": ["AI agent", "LLM agent", "human-AI"],
-        "reddit_subreddits": ["MachineLearning", "artificial", "LocalLLaMA"],
-        "reddit_keywords": ["agent", "human-AI", "agentic"],
-        "days_lookback": 7,
-        "bluesky_keywords": ["human-AI collaboration", "coding agents", "LLM agent", "HCI research"],
-        "bluesky_handles": ["janchristianblaise.bsky.social", "hci.bsky.social"],
-    }
-
-    if not CONFIG_MD.exists():
-        print(f"  ⚠ Config file not found ({CONFIG_MD}), using defaults")
-        return config
-
-    text = CONFIG_MD.read_text(encoding="utf-8")
-
-    # Only parse the "自动扫描配置" section
-    marker = "## 九、Research Radar 自动扫描配置"
-    idx = text.find(marker)
-    if idx == -1:
-        print("  ⚠ Config section not found in markdown, using defaults")
-        return config
-    section = text[idx:]
-
-    def extract_section(heading):
-        """Extract content between a ### heading and the next ### or ## heading."""
-        pattern = rf"### {re.escape(heading)}\s*\n(.*?)(?=\n###|\n##|\Z)"
-        m = re.search(pattern, section, re.DOTALL)
-        return m.group(1).strip() if m else ""
-
-    def parse_bullet_list(block):
-        """Parse '- item' lines into a list."""
-        return [line.lstrip("- ").strip() for line in block.splitlines()
-                if line.strip().startswith("- ")]
-
-    def parse_comma_list(block):
-        """Parse comma-separated values."""
-        return [item.strip() for item in block.split(",") if item.strip()]
-
-    def parse_link_table(block):
-        """Parse a markdown table into a list of dicts."""
-        items = []
-        headers = None
-        for line in block.splitlines():
-            line = line.strip()
-            if not line.startswith("|"):
-                continue
-            cells = [c.strip() for c in line.split("|")[1:-1]]
-            if not cells:
-                continue
-            if all(set(c) <= set("-: ") for c in cells):
-                continue
-            if headers is None:
-                headers = cells
-            else:
-                row = {}
-                for i, h in enumerate(headers):
-                    if i < len(cells):
-                        row[h] = cells[i]
-                items.append(row)
-        return items
-
-    # arXiv categories
-    raw = extract_section("arXiv 分类")
-    if raw:
-        config["arxiv_categories"] = parse_comma_list(raw)
-
-    # arXiv keywords
-    raw = extract_section("arXiv 关键词")
-    if raw:
-        config["arxiv_keywords"] = parse_bullet_list(raw)
-
-    # Semantic Scholar keywords
-    raw = extract_section("Semantic Scholar 关键词")
-    if raw:
-        config["s2_keywords"] = parse_bullet_list(raw)
-
-    # Tracked authors (table: | Name | ID |)
-    raw = extract_section("Semantic Scholar 跟踪作者")
-    if raw:
-        authors = {}
-        for line in raw.splitlines():
-            parts = [p.strip() for p in line.split("|") if p.strip()]
-            if len(parts) >= 2 and parts[1].isdigit():
-                authors[parts[0]] = parts[1]
-        if authors:
-            config["tracked_authors"] = authors
-
-    # HackerNews keywords
-    raw = extract_section("HackerNews 关键词")
-    if raw:
-        config["hn_keywords"] = parse_bullet_list(raw)
-
-    # Reddit subreddits
-    raw = extract_section("Reddit 子版块")
-    if raw:
-        config["reddit_subreddits"] = [
-            s.strip().lstrip("r/") for s in raw.split(",") if s.strip()
-        ]
-
-    # Reddit filter keywords
-    raw = extract_section("Reddit 过滤关键词")
-    if raw:
-        config["reddit_keywords"] = parse_comma_list(raw)
-
-    # Bluesky keywords
-    raw = extract_section("Bluesky 关键词")
-    if raw:
-        config["bluesky_keywords"] = parse_bullet_list(raw)
-
-    # Bluesky tracked handles
-    raw = extract_section("Bluesky 跟踪账号")
-    if raw:
-        config["bluesky_handles"] = parse_comma_list(raw)
-
-    # Days lookback
-    raw = extract_section("时间窗口")
-    if raw:
-        try:
-            config["days_lookback"] = int(raw.splitlines()[0].strip())
-        except ValueError:
-            pass
-
-    # Static link directories
-    config["blogs"] = parse_link_table(extract_section("公司/实验室博客"))
-    config["newsletters"] = parse_link_table(extract_section("Newsletter / 个人博客"))
-    config["researchers"] = parse_link_table(extract_section("推荐关注"))
-    config["seminars"] = parse_link_table(extract_section("Seminars/Talks"))
-    config["podcasts"] = parse_link_table(extract_section("播客"))
-    config["conferences"] = parse_link_table(extract_section("会议/Workshop"))
-    config["opportunities"] = parse_link_table(extract_section("Career/Grant Opportunities"))
-
-    return config
-
-
-# Load config at module level
-CFG = load_config()
-ARXIV_CATEGORIES = CFG["arxiv_categories"]
-ARXIV_KEYWORDS = CFG["arxiv_keywords"]
-SEMANTIC_SCHOLAR_KEYWORDS = CFG["s2_keywords"]
-TRACKED_AUTHORS = CFG["tracked_authors"]
-HN_KEYWORDS = CFG["hn_keywords"]
-REDDIT_SUBREDDITS = CFG["reddit_subreddits"]
-REDDIT_KEYWORDS = CFG["reddit_keywords"]
-DAYS_LOOKBACK = CFG["days_lookback"]
-BLUESKY_KEYWORDS = CFG.get("bluesky_keywords", ["human-AI collaboration", "coding agents", "LLM agent", "HCI research"])
-BLUESKY_HANDLES = CFG.get("bluesky_handles", ["janchristianblaise.bsky.social", "hci.bsky.social"])
 
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
-def safe_request(url, headers=None, max_retries=3, delay=2):
-    """Make HTTP request with retries and rate limiting."""
+def safe_request(url, headers=None, max_retries=3, delay=2, payload=None):
+    """Make HTTP request over a pooled keep-alive connection, with retries and rate limiting.
+
+    GETs `url`, or POSTs `payload` as JSON when one is given.
+    """
     if headers is None:
         headers = {"User-Agent": "ResearchRadar/1.0 (academic research tool)"}
-    req = urllib.request.Request(url, headers=headers)
-    for attempt in range(max_retries):
+    try:
+        if payload is not None:
+            resp = http_client.post_json(url, payload, headers=headers, timeout=30,
+                                         max_retries=max_retries, delay=delay)
+        else:
+            resp = http_client.get(url, headers=headers, timeout=30, max_retries=max_retries, delay=delay)
+        return resp.text()
+    except Exception as e:
+        print(f"  ✗ Request failed: {url[:80]}... — {e}")
+        return None
+
+
+# Paginated queries of one source run this many at a time; more would only
+# queue behind the connection pool's per-host limit
+QUERY_WORKERS = http_client.MAX_IN_FLIGHT_PER_HOST
+
+
+def fetch_each(fetch_one, queries, workers=QUERY_WORKERS):
+    """Return [fetch_one(query) for query in queries], running the queries concurrently.
+
+    Each query still walks its pages in order; the per-host rate limiter
+    keeps the request spacing. Telemetry labels carry over to the workers.
+    """
+    queries = list(queries)
+    if len(queries) < 2 or workers < 2:
+        return [fetch_one(query) for query in queries]
+    with ThreadPoolExecutor(max_workers=min(workers, len(queries))) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, fetch_one, query) for query in queries]
+        return [future.result() for future in futures]
+
+
+# ─── Incremental state ───────────────────────────────────────────────────────
+
+STATE_PATH = DATA_DIR / "fetch-state.json"
+
+
+class FetchState:
+    """Per-source high-water marks plus the items of the previous run.
+
+    Marks are keyed by source, then by keyword or subreddit, and hold the
+    newest date/timestamp already fetched. Fetchers ask only for newer items
+    and merge them into the previous window kept from latest.json. They also
+    record which queries returned each item, for multi-profile runs.
+    """
+
+    def __init__(self, marks=None, previous=None):
+        self.marks = marks or {}
+        self.previous = previous or {}
+        self.hits = {}
+
+    @classmethod
+    def load(cls, state_path=STATE_PATH, latest_path=DATA_DIR / "latest.json"):
+        """Load saved marks; without the previous window they are useless, so drop them."""
         try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                return resp.read().decode("utf-8")
-        except Exception as e:
-            if attempt < max_retries - 1:
-                time.sleep(delay * (attempt + 1))
-            else:
-                print(f"  ✗ Failed after {max_retries} attempts: {url[:80]}... — {e}")
-                return None
+            marks = json.loads(Path(state_path).read_text(encoding="utf-8"))
+            previous = json.loads(Path(latest_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls()
+        return cls(marks, previous)
+
+    def mark(self, source, key):
+        return self.marks.get(source, {}).get(key)
+
+    def advance(self, source, key, value):
+        """Raise the mark for (source, key) to `value` if it is newer."""
+        marks = self.marks.setdefault(source, {})
+        if value and (marks.get(key) is None or value > marks[key]):
+            marks[key] = value
+
+    def record(self, source, query, item_id):
+        """Note that `query` (a keyword, "author:…", "handle:…") returned `item_id` this run."""
+        queries = self.hits.setdefault(source, {}).setdefault(item_id, [])
+        if query not in queries:
+            queries.append(query)
 
+    def merge(self, source, items, cutoff):
+        """Combine freshly fetched items with the previous window, newest copy wins.
 
-def keyword_match(text, keywords):
-    """Check if any keyword appears in text (case-insensitive)."""
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in keywords)
+        Previous items published before `cutoff` (YYYY-MM-DD) fall out.
+        """
+        fresh_ids = {item["id"] for item in items}
+        kept = [item for item in self.previous.get(source, [])
+                if item.get("id") not in fresh_ids and item.get("published", "") >= cutoff]
+        return items + kept
+
+    def save(self, path=STATE_PATH):
+        write_json_atomic(path, self.marks)
+
+
+# Replaced in main(); an empty state means a full fetch of the lookback window
+STATE = FetchState()
 
 
 # ─── arXiv ───────────────────────────────────────────────────────────────────
 
+ARXIV_API = "http://export.arxiv.org/api/query"
+ARXIV_PAGE_SIZE = 200
+ARXIV_MAX_PAGES = 10
+# Longest URL-encoded search_query we send; the export API rejects much longer URLs
+ARXIV_MAX_QUERY_LEN = 1000
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV_DOI = "{http://arxiv.org/schemas/atom}doi"
+ATOM_ENTRY, ATOM_ID, ATOM_TITLE, ATOM_SUMMARY, ATOM_PUBLISHED, ATOM_AUTHOR, ATOM_NAME, ATOM_CATEGORY = (
+    _ATOM + tag for tag in ("entry", "id", "title", "summary", "published", "author", "name", "category")
+)
+
+
+def parse_arxiv_feed(xml_data, stop=None):
+    """Stream the entries of an arXiv Atom response as compact dicts.
+
+    Each <entry> is freed as soon as it has been read. The API returns
+    entries newest first, so with `stop` (YYYY-MM-DD) parsing ends at the
+    first entry published before it.
+    """
+    context = ET.iterparse(io.StringIO(xml_data), events=("start", "end"))
+    _, root = next(context)
+
+    for event, elem in context:
+        if event != "end" or elem.tag != ATOM_ENTRY:
+            continue
+        published = elem.findtext(ATOM_PUBLISHED, "")[:10]
+        if stop and published < stop:
+            break
+        yield {
+            "id": elem.findtext(ATOM_ID, "").split("/abs/")[-1],
+            "title": elem.findtext(ATOM_TITLE, "").strip().replace("\n", " "),
+            "summary": elem.findtext(ATOM_SUMMARY, "").strip().replace("\n", " "),
+            "published": published,
+            "authors": [a.findtext(ATOM_NAME) for a in elem.iterfind(ATOM_AUTHOR)],
+            "categories": [c.get("term") for c in elem.iterfind(ATOM_CATEGORY)],
+            "doi": elem.findtext(ARXIV_DOI),
+        }
+        root.clear()
+
+
+def arxiv_record(entry, keyword):
+    """Build the output item for a parsed arXiv entry."""
+    return {
+        "id": entry["id"],
+        "title": entry["title"],
+        "authors": entry["authors"][:5],  # Limit to first 5
+        "summary": entry["summary"][:500],
+        "abstract": entry["summary"],  # for enrich.py, which drops it
+        "published": entry["published"],
+        "categories": entry["categories"],  # all of them: profiles are scoped by category
+        "doi": entry.get("doi"),
+        "link": f"https://arxiv.org/abs/{entry['id']}",
+        "matched_keyword": keyword,
+        "source": "arxiv",
+    }
+
+
+def arxiv_url(query, start=0, max_results=20):
+    return (
+        f"{ARXIV_API}?search_query={urllib.parse.quote(query)}"
+        f"&start={start}&max_results={max_results}&sortBy=submittedDate&sortOrder=descending"
+    )
+
+
+def arxiv_query(keywords):
+    """Search our categories for any of `keywords`."""
+    cat_query = " OR ".join(f"cat:{c}" for c in get_config()["arxiv_categories"])
+    kw_query = " OR ".join(f'all:"{kw}"' for kw in keywords)
+    return f"({cat_query}) AND ({kw_query})"
+
+
+def batch_arxiv_keywords(keywords, max_len=ARXIV_MAX_QUERY_LEN):
+    """Greedily pack keywords into as few OR'd queries as fit in `max_len`."""
+    batches = []
+    for keyword in keywords:
+        if batches and len(urllib.parse.quote(arxiv_query(batches[-1] + [keyword]))) <= max_len:
+            batches[-1].append(keyword)
+        else:
+            batches.append([keyword])
+    return batches
+
+
+def _normalize(text):
+    return " " + re.sub(r"[^a-z0-9]+", " ", text.lower()) + " "
+
+
+def matched_arxiv_keywords(entry, keywords):
+    """Which of `keywords` an entry returned by an OR'd query matched, best first.
+
+    Phrase matches in the title come before those in the abstract; if
+    arXiv's stemming matched something no phrase covers, the answer is
+    every keyword sharing the most words with the text, in config order,
+    since any of them may be the one arXiv matched.
+    """
+    title = _normalize(entry["title"])
+    text = title + _normalize(entry["summary"])
+    normalized = [(kw, _normalize(kw)) for kw in keywords]
+    found = [kw for kw, norm in normalized if norm in title]
+    found += [kw for kw, norm in normalized if norm in text and kw not in found]
+    if found:
+        return found
+    words = set(text.split())
+    overlap = {kw: len(words.intersection(norm.split())) for kw, norm in normalized}
+    best = max(overlap.values())
+    return [kw for kw in keywords if overlap[kw] == best]
+
+
 def fetch_arxiv():
-    """Fetch recent papers from arXiv matching our categories and keywords."""
+    """Fetch recent papers from arXiv with batched OR'd keyword queries.
+
+    Keywords are packed into a few queries; each is paged through (newest
+    first) until results fall behind the lookback cutoff, or behind the
+    batch's high-water mark when a previous run already covered them.
+    """
     print("📄 Fetching arXiv papers...")
+    cfg = get_config()
     results = []
     seen_ids = set()
+    cutoff = (datetime.now() - timedelta(days=cfg["days_lookback"] + 2)).strftime("%Y-%m-%d")
+    requests_made = 0
+
+    for batch in batch_arxiv_keywords(cfg["arxiv_keywords"]):
+        query = arxiv_query(batch)
+        # Same-day submissions can still arrive, so the marked day is refetched
+        marks = [STATE.mark("arxiv", kw) for kw in batch]
+        stop = max([cutoff] + marks) if None not in marks else cutoff
+        newest = None
+        complete = False
+        for page in range(ARXIV_MAX_PAGES):
+            with telemetry.label(keyword=" OR ".join(batch)):
+                xml_data = safe_request(arxiv_url(query, page * ARXIV_PAGE_SIZE, ARXIV_PAGE_SIZE))
+            requests_made += 1
+            if not xml_data:
+                break
+
+            count = 0
+            for entry in parse_arxiv_feed(xml_data, stop=stop):
+                count += 1
+                newest = max(newest or "", entry["published"])
+                matched = matched_arxiv_keywords(entry, batch)
+                for kw in matched:
+                    STATE.record("arxiv", kw, entry["id"])
+                if entry["id"] in seen_ids:
+                    continue
+                seen_ids.add(entry["id"])
+                results.append(arxiv_record(entry, matched[0]))
+
+            # A short page means the feed ended or parsing stopped at the cutoff
+            if count < ARXIV_PAGE_SIZE:
+                complete = True
+                break
+
+        # A failed page or the page cap leaves a gap below what was read;
+        # the old marks stay so the next run fetches it
+        if complete:
+            for kw in batch:
+                STATE.advance("arxiv", kw, newest)
+
+    new_count = len(results)
+    results = STATE.merge("arxiv", results, cutoff)
+    results.sort(key=lambda x: x["published"], reverse=True)
+    print(f"  ✓ Found {len(results)} arXiv papers ({new_count} fetched, {requests_made} requests)")
+    return results
 
-    for keyword in ARXIV_KEYWORDS:
-        # Search across our categories with this keyword
-        cat_query = " OR ".join(f"cat:{c}" for c in ARXIV_CATEGORIES)
-        query = f'({cat_query}) AND all:"{keyword}"'
-        url = (
-            f"http://export.arxiv.org/api/query?search_query={urllib.parse.quote(query)}"
-            f"&start=0&max_results=20&sortBy=submittedDate&sortOrder=descending"
-        )
 
-        xml_data = safe_request(url)
+def fetch_arxiv_per_keyword():
+    """Fetch recent papers from arXiv with one query per keyword."""
+    print("📄 Fetching arXiv papers...")
+    cfg = get_config()
+    results = []
+    seen_ids = set()
+    cutoff = (datetime.now() - timedelta(days=cfg["days_lookback"] + 2)).strftime("%Y-%m-%d")
+
+    for keyword in cfg["arxiv_keywords"]:
+        with telemetry.label(keyword=keyword):
+            xml_data = safe_request(arxiv_url(arxiv_query([keyword])))
         if not xml_data:
             continue
 
-        root = ET.fromstring(xml_data)
-        ns = {"atom": "http://www.w3.org/2005/Atom"}
-
-        for entry in root.findall("atom:entry", ns):
-            arxiv_id = entry.find("atom:id", ns).text.split("/abs/")[-1]
-            if arxiv_id in seen_ids:
+        for entry in parse_arxiv_feed(xml_data, stop=cutoff):
+            STATE.record("arxiv", keyword, entry["id"])
+            if entry["id"] in seen_ids:
                 continue
-            seen_ids.add(arxiv_id)
-
-            title = entry.find("atom:title", ns).text.strip().replace("\n", " ")
-            summary = entry.find("atom:summary", ns).text.strip().replace("\n", " ")
-            published = entry.find("atom:published", ns).text[:10]
-            authors = [a.find("atom:name", ns).text for a in entry.findall("atom:author", ns)]
-            categories = [c.get("term") for c in entry.findall("atom:category", ns)]
-            link = f"https://arxiv.org/abs/{arxiv_id}"
-
-            # Check if within lookback window
-            pub_date = datetime.strptime(published, "%Y-%m-%d")
-            if pub_date < datetime.now() - timedelta(days=DAYS_LOOKBACK + 2):
-                continue
-
-            results.append({
-                "id": arxiv_id,
-                "title": title,
-                "authors": authors[:5],  # Limit to first 5
-                "summary": summary[:500],
-                "published": published,
-                "categories": categories[:5],
-                "link": link,
-                "matched_keyword": keyword,
-                "source": "arxiv",
-            })
-
-        time.sleep(3)  # Be nice to arXiv API
+            seen_ids.add(entry["id"])
+            results.append(arxiv_record(entry, keyword))
 
     # Deduplicate and sort by date
     results.sort(key=lambda x: x["published"], reverse=True)
@@ -266,9 +330,101 @@ def fetch_arxiv():
 
 # ─── Semantic Scholar ────────────────────────────────────────────────────────
 
+S2_API = "https://api.semanticscholar.org/graph/v1"
+S2_PAPER_FIELDS = "title,authors,abstract,year,url,publicationDate,citationCount,externalIds"
+S2_KEYWORD_LIMIT = 10         # top results by relevance, per keyword
+S2_AUTHOR_PAPER_LIMIT = 5
+S2_AUTHOR_BATCH_SIZE = 1000   # API maximum for /author/batch
+S2_PAPER_BATCH_SIZE = 500     # API maximum for /paper/batch
+
+
+def s2_record(paper, matched_keyword):
+    """Build the output item for a Semantic Scholar paper."""
+    external_ids = paper.get("externalIds") or {}
+    return {
+        "id": paper["paperId"],
+        "title": paper.get("title", ""),
+        "authors": [a["name"] for a in (paper.get("authors") or [])[:5]],
+        "summary": (paper.get("abstract") or "")[:500],
+        "abstract": paper.get("abstract") or "",  # for enrich.py, which drops it
+        "published": paper.get("publicationDate") or str(paper.get("year") or datetime.now().year),
+        "citations": paper.get("citationCount", 0),
+        "arxiv_id": external_ids.get("ArXiv"),
+        "doi": external_ids.get("DOI"),
+        "link": paper.get("url", ""),
+        "matched_keyword": matched_keyword,
+        "source": "semantic_scholar",
+    }
+
+
+def s2_json(url, headers, payload=None):
+    """Request an S2 endpoint and decode the JSON answer (None on failure)."""
+    data = safe_request(url, headers=headers, payload=payload)
+    if not data:
+        return None
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        return None
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _s2_date(paper):
+    """publicationDate, else the year, else "" (sorts last, and is never too old)."""
+    return paper.get("publicationDate") or str(paper.get("year") or "")
+
+
+def fetch_s2_author_papers(headers, since):
+    """Recent papers of every tracked author in a handful of batch requests.
+
+    /author/batch lists each author's paper IDs and dates, the newest few
+    published on or after `since` are kept, and /paper/batch hydrates them.
+    Papers without a full date are kept unless their year is too old.
+    Returns [(paper, author_name)].
+    """
+    names = {author_id: name for name, author_id in get_config()["tracked_authors"].items()}
+    wanted = []  # (paperId, author_name), newest first per author
+    for ids in _chunks(list(names), S2_AUTHOR_BATCH_SIZE):
+        authors = s2_json(
+            f"{S2_API}/author/batch?fields=papers.paperId,papers.publicationDate,papers.year",
+            headers, payload={"ids": ids},
+        )
+        # Results come back in request order, with null for unknown IDs
+        for author_id, author in zip(ids, authors or []):
+            if not author:
+                continue
+            recent = sorted(
+                (p for p in author.get("papers") or []
+                 if p.get("paperId") and _s2_date(p) >= since[:len(_s2_date(p))]),
+                key=_s2_date, reverse=True,
+            )
+            wanted.extend((p["paperId"], names[author_id]) for p in recent[:S2_AUTHOR_PAPER_LIMIT])
+
+    papers = []
+    for chunk in _chunks(wanted, S2_PAPER_BATCH_SIZE):
+        hydrated = s2_json(
+            f"{S2_API}/paper/batch?fields={S2_PAPER_FIELDS}",
+            headers, payload={"ids": [pid for pid, _ in chunk]},
+        )
+        for paper, (_, name) in zip(hydrated or [], chunk):
+            if paper and paper.get("paperId"):
+                papers.append((paper, name))
+    return papers
+
+
 def fetch_semantic_scholar():
-    """Fetch papers from Semantic Scholar by keywords and tracked authors."""
+    """Fetch papers from Semantic Scholar by keywords and tracked authors.
+
+    Keywords go through the relevance-ranked /paper/search with the date
+    window applied server-side (papers with only a year are kept by it);
+    tracked authors cost a few batch requests in total.
+    """
     print("🔬 Fetching Semantic Scholar papers...")
+    cfg = get_config()
     results = []
     seen_ids = set()
     api_key = os.environ.get("S2_API_KEY", "")
@@ -277,93 +433,39 @@ def fetch_semantic_scholar():
         headers["x-api-key"] = api_key
 
     # Keyword search
-    for keyword in SEMANTIC_SCHOLAR_KEYWORDS:
+    since = (datetime.now() - timedelta(days=cfg["days_lookback"] * 4)).strftime("%Y-%m-%d")
+    for keyword in cfg["s2_keywords"]:
         url = (
-            f"https://api.semanticscholar.org/graph/v1/paper/search"
+            f"{S2_API}/paper/search"
             f"?query={urllib.parse.quote(keyword)}"
-            f"&limit=10&fields=title,authors,abstract,year,url,publicationDate,citationCount"
-            f"&year={datetime.now().year}-{datetime.now().year}"
+            f"&limit={S2_KEYWORD_LIMIT}&fields={S2_PAPER_FIELDS}"
+            f"&publicationDateOrYear={since}:"
         )
-
-        data = safe_request(url, headers=headers)
-        if not data:
+        with telemetry.label(keyword=keyword):
+            parsed = s2_json(url, headers)
+        if not parsed:
             continue
 
-        try:
-            parsed = json.loads(data)
-            for paper in parsed.get("data", []):
-                pid = paper.get("paperId", "")
-                if pid in seen_ids or not pid:
-                    continue
-                seen_ids.add(pid)
-
-                pub_date = paper.get("publicationDate", "")
-                if pub_date:
-                    try:
-                        pd = datetime.strptime(pub_date, "%Y-%m-%d")
-                        if pd < datetime.now() - timedelta(days=DAYS_LOOKBACK * 4):
-                            continue
-                    except ValueError:
-                        pass
-
-                results.append({
-                    "id": pid,
-                    "title": paper.get("title", ""),
-                    "authors": [a["name"] for a in paper.get("authors", [])[:5]],
-                    "summary": (paper.get("abstract") or "")[:500],
-                    "published": pub_date or str(datetime.now().year),
-                    "citations": paper.get("citationCount", 0),
-                    "link": paper.get("url", ""),
-                    "matched_keyword": keyword,
-                    "source": "semantic_scholar",
-                })
-        except json.JSONDecodeError:
-            pass
-
-        time.sleep(1)
+        for paper in parsed.get("data") or []:
+            pid = paper.get("paperId", "")
+            if not pid:
+                continue
+            STATE.record("semantic_scholar", keyword, pid)
+            if pid in seen_ids:
+                continue
+            seen_ids.add(pid)
+            results.append(s2_record(paper, keyword))
 
     # Tracked authors - recent papers
-    for author_name, author_id in TRACKED_AUTHORS.items():
-        url = (
-            f"https://api.semanticscholar.org/graph/v1/author/{author_id}/papers"
-            f"?limit=5&fields=title,authors,abstract,year,url,publicationDate,citationCount"
-        )
-        data = safe_request(url, headers=headers)
-        if not data:
+    since = (datetime.now() - timedelta(days=60)).strftime("%Y-%m-%d")
+    with telemetry.label(keyword="authors"):
+        author_papers = fetch_s2_author_papers(headers, since)
+    for paper, author_name in author_papers:
+        STATE.record("semantic_scholar", f"author:{author_name}", paper["paperId"])
+        if paper["paperId"] in seen_ids:
             continue
-
-        try:
-            parsed = json.loads(data)
-            for paper in parsed.get("data", []):
-                pid = paper.get("paperId", "")
-                if pid in seen_ids or not pid:
-                    continue
-                seen_ids.add(pid)
-
-                pub_date = paper.get("publicationDate", "")
-                if pub_date:
-                    try:
-                        pd = datetime.strptime(pub_date, "%Y-%m-%d")
-                        if pd < datetime.now() - timedelta(days=60):
-                            continue
-                    except ValueError:
-                        pass
-
-                results.append({
-                    "id": pid,
-                    "title": paper.get("title", ""),
-                    "authors": [a["name"] for a in paper.get("authors", [])[:5]],
-                    "summary": (paper.get("abstract") or "")[:500],
-                    "published": pub_date or str(datetime.now().year),
-                    "citations": paper.get("citationCount", 0),
-                    "link": paper.get("url", ""),
-                    "matched_keyword": f"author:{author_name}",
-                    "source": "semantic_scholar",
-                })
-        except json.JSONDecodeError:
-            pass
-
-        time.sleep(1)
+        seen_ids.add(paper["paperId"])
+        results.append(s2_record(paper, f"author:{author_name}"))
 
     results.sort(key=lambda x: x.get("published", ""), reverse=True)
     print(f"  ✓ Found {len(results)} Semantic Scholar papers")
@@ -372,125 +474,284 @@ def fetch_semantic_scholar():
 
 # ─── HackerNews ──────────────────────────────────────────────────────────────
 
-def fetch_hackernews():
-    """Fetch relevant HN stories using Algolia search API."""
-    print("🟠 Fetching HackerNews stories...")
-    results = []
-    seen_ids = set()
-    cutoff = int((datetime.now() - timedelta(days=DAYS_LOOKBACK)).timestamp())
+# search_by_date lists newest first, so the created_at_i filter ends the
+# result pages exactly at the window's start
+HN_SEARCH = "https://hn.algolia.com/api/v1/search_by_date"
+HN_PAGE_SIZE = 50
+HN_MAX_PAGES = 20
+HN_REFRESH_BATCH = 100    # story_<id> tags per refresh query
+
 
-    for keyword in HN_KEYWORDS:
+def hn_stories(keyword, since):
+    """Stories matching `keyword` created after `since`, one Algolia page at a time.
+
+    Returns (hits, complete); `complete` is False if a failed page or the
+    page cap ended the walk before `since`.
+    """
+    hits = []
+    for page in range(HN_MAX_PAGES):
         url = (
-            f"https://hn.algolia.com/api/v1/search?"
+            f"{HN_SEARCH}?"
             f"query={urllib.parse.quote(keyword)}"
-            f"&tags=story&numericFilters=created_at_i>{cutoff}"
-            f"&hitsPerPage=10"
+            f"&tags=story&numericFilters=created_at_i>{since}"
+            f"&hitsPerPage={HN_PAGE_SIZE}&page={page}"
         )
-
-        data = safe_request(url)
+        with telemetry.label(keyword=keyword):
+            data = safe_request(url)
         if not data:
-            continue
-
+            break
         try:
             parsed = json.loads(data)
-            for hit in parsed.get("hits", []):
-                hid = hit.get("objectID", "")
-                if hid in seen_ids:
-                    continue
-                seen_ids.add(hid)
-
-                results.append({
-                    "id": hid,
-                    "title": hit.get("title", ""),
-                    "link": hit.get("url") or f"https://news.ycombinator.com/item?id={hid}",
-                    "hn_link": f"https://news.ycombinator.com/item?id={hid}",
-                    "points": hit.get("points", 0),
-                    "comments": hit.get("num_comments", 0),
-                    "published": hit.get("created_at", "")[:10],
-                    "matched_keyword": keyword,
-                    "source": "hackernews",
-                })
         except json.JSONDecodeError:
-            pass
+            break
+        batch = parsed.get("hits", [])
+        hits.extend(batch)
+        if len(batch) < HN_PAGE_SIZE or page + 1 >= parsed.get("nbPages", 0):
+            return hits, True
+    return hits, False
+
+
+def refresh_hn_engagement(items):
+    """Update points and comments of stories carried over from the previous run.
+
+    Marks keep them from being fetched again, so without this they would
+    keep the counts they had minutes after posting.
+    """
+    by_id = {item["id"]: item for item in items}
+
+    def refresh(ids):
+        tags = urllib.parse.quote(f"story,({','.join(f'story_{hid}' for hid in ids)})")
+        with telemetry.label(keyword="refresh"):
+            data = safe_request(f"https://hn.algolia.com/api/v1/search?tags={tags}&hitsPerPage={len(ids)}")
+        try:
+            return json.loads(data).get("hits", []) if data else []
+        except json.JSONDecodeError:
+            return []
+
+    for hits in fetch_each(refresh, list(_chunks(list(by_id), HN_REFRESH_BATCH))):
+        for hit in hits:
+            item = by_id.get(hit.get("objectID"))
+            if item:
+                item["points"] = hit.get("points", item["points"])
+                item["comments"] = hit.get("num_comments", item["comments"])
 
-        time.sleep(0.5)
 
+def fetch_hackernews():
+    """Fetch relevant HN stories using Algolia search API."""
+    print("🟠 Fetching HackerNews stories...")
+    cfg = get_config()
+    results = []
+    seen_ids = set()
+    cutoff = int((datetime.now() - timedelta(days=cfg["days_lookback"])).timestamp())
+    # Whole hours keep the query URL stable within the hour (cache, fixtures)
+    cutoff -= cutoff % 3600
+
+    keywords = cfg["hn_keywords"]
+    pages = fetch_each(
+        lambda keyword: hn_stories(keyword, max(cutoff, STATE.mark("hackernews", keyword) or 0)),
+        keywords)
+
+    for keyword, (hits, complete) in zip(keywords, pages):
+        for hit in hits:
+            # Only a walk that reached the old mark may move it
+            if complete:
+                STATE.advance("hackernews", keyword, hit.get("created_at_i"))
+            hid = hit.get("objectID", "")
+            STATE.record("hackernews", keyword, hid)
+            if hid in seen_ids:
+                continue
+            seen_ids.add(hid)
+
+            results.append({
+                "id": hid,
+                "title": hit.get("title", ""),
+                "link": hit.get("url") or f"https://news.ycombinator.com/item?id={hid}",
+                "hn_link": f"https://news.ycombinator.com/item?id={hid}",
+                "points": hit.get("points", 0),
+                "comments": hit.get("num_comments", 0),
+                "published": hit.get("created_at", "")[:10],
+                "matched_keyword": keyword,
+                "source": "hackernews",
+            })
+
+    new_count = len(results)
+    cutoff_date = datetime.fromtimestamp(cutoff).strftime("%Y-%m-%d")
+    results = STATE.merge("hackernews", results, cutoff_date)
+    refresh_hn_engagement(results[new_count:])
     results.sort(key=lambda x: x.get("points", 0), reverse=True)
-    print(f"  ✓ Found {len(results)} HN stories")
+    print(f"  ✓ Found {len(results)} HN stories ({new_count} fetched)")
     return results
 
 
 # ─── Reddit ──────────────────────────────────────────────────────────────────
 
-def fetch_reddit():
-    """Fetch relevant Reddit posts."""
-    print("🔴 Fetching Reddit posts...")
-    results = []
-    seen_ids = set()
-
-    for subreddit in REDDIT_SUBREDDITS:
-        url = f"https://www.reddit.com/r/{subreddit}/new.json?limit=50"
-        headers = {"User-Agent": "ResearchRadar/1.0 (academic research aggregator)"}
-
-        data = safe_request(url, headers=headers)
+REDDIT_PAGE_SIZE = 100    # the listing maximum
+REDDIT_MAX_PAGES = 10
+REDDIT_REFRESH_BATCH = 100    # the /by_id maximum
+
+
+def reddit_new_posts(subreddit, stop):
+    """Posts of r/subreddit/new created after the `stop` timestamp, following `after` cursors.
+
+    Returns (posts, complete); `complete` is False if a failed page or the
+    page cap ended the walk before `stop`.
+    """
+    headers = {"User-Agent": "ResearchRadar/1.0 (academic research aggregator)"}
+    posts = []
+    after = None
+    for _ in range(REDDIT_MAX_PAGES):
+        url = f"https://www.reddit.com/r/{subreddit}/new.json?limit={REDDIT_PAGE_SIZE}"
+        if after:
+            url += f"&after={after}"
+        with telemetry.label(keyword=f"r/{subreddit}"):
+            data = safe_request(url, headers=headers)
         if not data:
-            continue
-
+            break
         try:
-            parsed = json.loads(data)
-            for child in parsed.get("data", {}).get("children", []):
-                post = child.get("data", {})
-                rid = post.get("id", "")
-                if rid in seen_ids:
-                    continue
-
-                title = post.get("title", "")
-                selftext = post.get("selftext", "")
-                combined = f"{title} {selftext}"
+            listing = json.loads(data).get("data", {})
+        except json.JSONDecodeError:
+            break
+        for child in listing.get("children", []):
+            post = child.get("data", {})
+            # new.json is newest first: the first post at or before `stop` ends the walk
+            if post.get("created_utc", 0) <= stop:
+                return posts, True
+            posts.append(post)
+        after = listing.get("after")
+        if not after:
+            return posts, True
+    return posts, False
+
+
+def refresh_reddit_engagement(items):
+    """Update score and comments of posts carried over from the previous run."""
+    headers = {"User-Agent": "ResearchRadar/1.0 (academic research aggregator)"}
+    by_id = {item["id"]: item for item in items}
+
+    def refresh(ids):
+        names = ",".join(f"t3_{rid}" for rid in ids)
+        with telemetry.label(keyword="refresh"):
+            data = safe_request(f"https://www.reddit.com/by_id/{names}.json?limit={len(ids)}", headers=headers)
+        try:
+            return json.loads(data).get("data", {}).get("children", []) if data else []
+        except json.JSONDecodeError:
+            return []
 
-                if not keyword_match(combined, REDDIT_KEYWORDS):
-                    continue
+    for children in fetch_each(refresh, list(_chunks(list(by_id), REDDIT_REFRESH_BATCH))):
+        for child in children:
+            post = child.get("data", {})
+            item = by_id.get(post.get("id"))
+            if item:
+                item["score"] = post.get("score", item["score"])
+                item["comments"] = post.get("num_comments", item["comments"])
 
-                seen_ids.add(rid)
 
-                created = datetime.fromtimestamp(post.get("created_utc", 0))
-                if created < datetime.now() - timedelta(days=DAYS_LOOKBACK):
-                    continue
+def fetch_reddit():
+    """Fetch relevant Reddit posts."""
+    print("🔴 Fetching Reddit posts...")
+    cfg = get_config()
+    results = []
+    seen_ids = set()
+    matcher = compile_keywords(cfg["reddit_keywords"])
+    cutoff = int((datetime.now() - timedelta(days=cfg["days_lookback"])).timestamp())
+
+    subreddits = cfg["reddit_subreddits"]
+    pages = fetch_each(
+        lambda subreddit: reddit_new_posts(subreddit, max(cutoff, STATE.mark("reddit", subreddit) or 0)),
+        subreddits)
+
+    for subreddit, (posts, complete) in zip(subreddits, pages):
+        for post in posts:
+            # Only a walk that reached the old mark may move it
+            if complete:
+                STATE.advance("reddit", subreddit, post.get("created_utc"))
+            rid = post.get("id", "")
+            if rid in seen_ids:
+                continue
 
-                results.append({
-                    "id": rid,
-                    "title": title,
-                    "subreddit": subreddit,
-                    "link": f"https://reddit.com{post.get('permalink', '')}",
-                    "score": post.get("score", 0),
-                    "comments": post.get("num_comments", 0),
-                    "published": created.strftime("%Y-%m-%d"),
-                    "matched_keyword": next(
-                        (kw for kw in REDDIT_KEYWORDS if kw.lower() in combined.lower()),
-                        ""
-                    ),
-                    "source": "reddit",
-                })
-        except json.JSONDecodeError:
-            pass
+            title = post.get("title", "")
+            selftext = post.get("selftext", "")
+            matched = matcher.matched(f"{title} {selftext}")
+            if not matched:
+                continue
+            for keyword in matched:
+                STATE.record("reddit", keyword, rid)
 
-        time.sleep(2)
+            seen_ids.add(rid)
+            created = datetime.fromtimestamp(post.get("created_utc", 0))
+            results.append({
+                "id": rid,
+                "title": title,
+                "subreddit": subreddit,
+                "link": f"https://reddit.com{post.get('permalink', '')}",
+                "score": post.get("score", 0),
+                "comments": post.get("num_comments", 0),
+                "published": created.strftime("%Y-%m-%d"),
+                "matched_keyword": matched[0],
+                "source": "reddit",
+            })
 
+    new_count = len(results)
+    cutoff_date = datetime.fromtimestamp(cutoff).strftime("%Y-%m-%d")
+    results = STATE.merge("reddit", results, cutoff_date)
+    refresh_reddit_engagement(results[new_count:])
     results.sort(key=lambda x: x.get("score", 0), reverse=True)
-    print(f"  ✓ Found {len(results)} Reddit posts")
+    print(f"  ✓ Found {len(results)} Reddit posts ({new_count} fetched)")
     return results
 
 
 # ─── Bluesky ─────────────────────────────────────────────────────────────────
 
+BLUESKY_API = "https://public.api.bsky.app/xrpc"
+BLUESKY_PAGE_SIZE = 100   # the maximum for both searchPosts and getAuthorFeed
+BLUESKY_MAX_PAGES = 5
+
+
+def bluesky_posts(url, key, cutoff):
+    """Posts of a newest-first Bluesky endpoint (`posts` or `feed` shaped),
+    following `cursor` until one was created before `cutoff` (YYYY-MM-DD)."""
+    posts = []
+    cursor = None
+    for _ in range(BLUESKY_MAX_PAGES):
+        page_url = f"{url}&limit={BLUESKY_PAGE_SIZE}"
+        if cursor:
+            page_url += f"&cursor={urllib.parse.quote(cursor)}"
+        with telemetry.label(keyword=key):
+            data = safe_request(page_url)
+        if not data:
+            break
+        try:
+            parsed = json.loads(data)
+        except json.JSONDecodeError:
+            break
+        if "feed" in parsed:
+            entries = [(entry.get("post", {}), "reason" in entry) for entry in parsed["feed"]]
+        else:
+            entries = [(post, False) for post in parsed.get("posts", [])]
+        for post, reposted in entries:
+            # Reposts are ordered by when they were reposted, so their dates say nothing
+            created = post.get("record", {}).get("createdAt", "")
+            if not reposted and created and created[:10] < cutoff:
+                return posts
+            posts.append(post)
+        cursor = parsed.get("cursor")
+        if not cursor:
+            break
+    return posts
+
+
 def fetch_bluesky():
     """Fetch posts from Bluesky via public API (no auth required)."""
     print("🦋 Fetching Bluesky posts...")
+    cfg = get_config()
     results = []
     seen_uris = set()
+    cutoff = (datetime.now() - timedelta(days=cfg["days_lookback"])).strftime("%Y-%m-%d")
 
     def parse_post(post, matched_keyword):
         uri = post.get("uri", "")
+        if uri:
+            STATE.record("bluesky", matched_keyword, uri)
         if not uri or uri in seen_uris:
             return None
         seen_uris.add(uri)
@@ -505,7 +766,7 @@ def fetch_bluesky():
         if published:
             try:
                 pub_date = datetime.strptime(published, "%Y-%m-%d")
-                if pub_date < datetime.now() - timedelta(days=DAYS_LOOKBACK):
+                if pub_date < datetime.now() - timedelta(days=cfg["days_lookback"]):
                     return None
             except ValueError:
                 pass
@@ -514,6 +775,7 @@ def fetch_bluesky():
             "title": text[:120] + ("..." if len(text) > 120 else ""),
             "authors": [handle],
             "summary": text[:500],
+            "abstract": text,  # for enrich.py, which drops it
             "published": published,
             "likes": post.get("likeCount", 0),
             "reposts": post.get("repostCount", 0),
@@ -522,44 +784,21 @@ def fetch_bluesky():
             "source": "bluesky",
         }
 
-    # Keyword search
-    for keyword in BLUESKY_KEYWORDS:
-        url = (
-            f"https://public.api.bsky.app/xrpc/app.bsky.feed.searchPosts"
-            f"?q={urllib.parse.quote(keyword)}&limit=10"
-        )
-        data = safe_request(url)
-        if not data:
-            continue
-        try:
-            parsed = json.loads(data)
-            for post in parsed.get("posts", []):
-                item = parse_post(post, keyword)
-                if item:
-                    results.append(item)
-        except json.JSONDecodeError:
-            pass
-        time.sleep(0.5)
-
-    # Fetch from tracked handles
-    for handle in BLUESKY_HANDLES:
-        url = (
-            f"https://public.api.bsky.app/xrpc/app.bsky.feed.getAuthorFeed"
-            f"?actor={urllib.parse.quote(handle)}&limit=10"
-        )
-        data = safe_request(url)
-        if not data:
-            continue
-        try:
-            parsed = json.loads(data)
-            for feed_item in parsed.get("feed", []):
-                post = feed_item.get("post", {})
-                item = parse_post(post, f"handle:{handle}")
-                if item:
-                    results.append(item)
-        except json.JSONDecodeError:
-            pass
-        time.sleep(0.5)
+    # Keyword search, newest first, plus the tracked handles' feeds
+    since = urllib.parse.quote(f"{cutoff}T00:00:00Z")
+    queries = [(f"{BLUESKY_API}/app.bsky.feed.searchPosts"
+                f"?q={urllib.parse.quote(keyword)}&sort=latest&since={since}", keyword)
+               for keyword in cfg["bluesky_keywords"]]
+    queries += [(f"{BLUESKY_API}/app.bsky.feed.getAuthorFeed?actor={urllib.parse.quote(handle)}",
+                 f"handle:{handle}")
+                for handle in cfg["bluesky_handles"]]
+    pages = fetch_each(lambda query: bluesky_posts(*query, cutoff), queries)
+
+    for (_, matched_keyword), posts in zip(queries, pages):
+        for post in posts:
+            item = parse_post(post, matched_keyword)
+            if item:
+                results.append(item)
 
     results.sort(key=lambda x: x.get("published", ""), reverse=True)
     print(f"  ✓ Found {len(results)} Bluesky posts")
@@ -568,54 +807,191 @@ def fetch_bluesky():
 
 # ─── Main ────────────────────────────────────────────────────────────────────
 
-def main():
-    print(f"\n{'='*60}")
-    print(f"  Research Radar — {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    print(f"{'='*60}\n")
+# Under the data dir's gitignored .cache/: per-request telemetry is not worth committing
+REPORT_PATH = Path(".cache") / "run-report.json"
+
+
+def fetch_faculty():
+    """Run the faculty job fetcher, tolerating any failure."""
+    try:
+        from fetch_faculty_jobs import collect_jobs
+        return collect_jobs()
+    except Exception as e:
+        print(f"⚠ Faculty jobs fetch failed: {e}")
+        return []
+
+
+SOURCES = {
+    "arxiv": fetch_arxiv,
+    "semantic_scholar": fetch_semantic_scholar,
+    "hackernews": fetch_hackernews,
+    "reddit": fetch_reddit,
+    "bluesky": fetch_bluesky,
+    "faculty_jobs": fetch_faculty,
+}
+
+
+def timed_fetch(name, fetch):
+    """Run one fetcher inside a telemetry span labelled with its source."""
+    with telemetry.span(name, source=name) as span:
+        items = fetch()
+        span["items"] = len(items)
+    return items
+
+
+def run_sources(sources=None, serial=False):
+    """Run every fetcher and return {source: items}.
 
+    Sources hit different hosts, so by default they run concurrently and the
+    per-host rate limiters keep each API's request spacing unchanged.
+    """
+    sources = sources or SOURCES
+    if serial:
+        return {name: timed_fetch(name, fetch) for name, fetch in sources.items()}
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        futures = {name: pool.submit(timed_fetch, name, fetch) for name, fetch in sources.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def write_run(fetched, cfg, data_dir, profile=None):
+    """Assemble one config's data from the fetched items, enrich, score and write it.
+
+    Returns (all_data, path of latest.json).
+    """
     all_data = {
         "meta": {
             "fetched_at": datetime.now().isoformat(),
-            "lookback_days": DAYS_LOOKBACK,
-            "keywords": ARXIV_KEYWORDS,
+            "lookback_days": cfg["days_lookback"],
+            "keywords": cfg["arxiv_keywords"],
+            **({"profile": profile} if profile else {}),
         },
-        "arxiv": fetch_arxiv(),
-        "semantic_scholar": fetch_semantic_scholar(),
-        "hackernews": fetch_hackernews(),
-        "reddit": fetch_reddit(),
-        "bluesky": fetch_bluesky(),
-        "blogs": CFG["blogs"],
-        "newsletters": CFG["newsletters"],
-        "researchers": CFG["researchers"],
-        "seminars": CFG.get("seminars", []),
-        "podcasts": CFG["podcasts"],
-        "conferences": CFG["conferences"],
-        "opportunities": CFG.get("opportunities", []),
+        "arxiv": fetched["arxiv"],
+        "semantic_scholar": fetched["semantic_scholar"],
+        "hackernews": fetched["hackernews"],
+        "reddit": fetched["reddit"],
+        "bluesky": fetched["bluesky"],
+        "blogs": cfg["blogs"],
+        "newsletters": cfg["newsletters"],
+        "researchers": cfg["researchers"],
+        "seminars": cfg["seminars"],
+        "podcasts": cfg["podcasts"],
+        "conferences": cfg["conferences"],
+        "opportunities": cfg["opportunities"],
+        "faculty_jobs": fetched["faculty_jobs"],
     }
 
-    # Fetch faculty jobs
-    try:
-        from fetch_faculty_jobs import main as fetch_faculty
-        faculty_jobs = fetch_faculty()
-        all_data["faculty_jobs"] = faculty_jobs
-    except Exception as e:
-        print(f"⚠ Faculty jobs fetch failed: {e}")
-        all_data["faculty_jobs"] = []
-
-    # Write combined data
-    output_path = DATA_DIR / "latest.json"
-    with open(output_path, "w") as f:
-        json.dump(all_data, f, indent=2, ensure_ascii=False)
-
-    # Also write a dated archive
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    archive_path = DATA_DIR / f"archive-{date_str}.json"
-    with open(archive_path, "w") as f:
-        json.dump(all_data, f, indent=2, ensure_ascii=False)
-
-    total = sum(len(all_data[k]) for k in ["arxiv", "semantic_scholar", "hackernews", "reddit", "bluesky"])
-    print(f"\n✅ Done! Total items: {total}")
-    print(f"   Output: {output_path}")
+    merged = dedupe_papers(all_data)
+    if merged:
+        print(f"\n🔗 Merged {merged} duplicate papers across arXiv / Semantic Scholar")
+    enriched, cached = enrich_items(all_data, cfg, cache_for(data_dir))
+    print(f"🧩 Enriched {enriched} items ({cached} unchanged, from cache)")
+    score_items(all_data, cfg)
+
+    # Every artifact is written once, from memory
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    return all_data, write_outputs(all_data, data_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar fetcher")
+    parser.add_argument("--serial", action="store_true",
+                        help="run sources one after another instead of concurrently")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="skip the on-disk conditional-request cache (.cache/http)")
+    parser.add_argument("--arxiv-per-keyword", action="store_true",
+                        help="query arXiv once per keyword instead of in OR'd batches")
+    parser.add_argument("--full", action="store_true",
+                        help="ignore saved high-water marks and refetch the whole lookback window")
+    parser.add_argument("--report", type=Path,
+                        help="where to write the run report (default: .cache/run-report.json in the data dir)")
+    parser.add_argument("--trace", type=Path,
+                        help="also write a Chrome trace (chrome://tracing, Perfetto) here")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR,
+                        help="where outputs and fetch state live (default: docs/data)")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument("--record", type=Path, metavar="DIR",
+                          help="save every response as a fixture under DIR")
+    fixtures.add_argument("--replay", type=Path, metavar="DIR",
+                          help="answer every request from fixtures under DIR, without network")
+    parser.add_argument("--standin", metavar="URL",
+                        help="send all requests to a stand-in server (scripts/standin_server.py)")
+    parser.add_argument("--profile", type=Path, action="append", metavar="MD",
+                        help="a config file to fetch for; repeat to fetch several profiles at once, "
+                             "each written to DATA_DIR/<file stem>/")
+    args = parser.parse_args(argv)
+
+    telemetry.reset()
+    profiles = None
+    if args.profile:
+        missing = [str(path) for path in args.profile if not path.is_file()]
+        if missing:
+            parser.error(f"profile not found: {', '.join(missing)}")
+        try:
+            profiles = load_profiles(args.profile)
+        except ValueError as e:
+            parser.error(str(e))
+        # Fetchers see the union of every profile's queries
+        use_config(union_config(profiles.values()))
+    cfg = get_config()
+    data_dir = args.data_dir
+    data_dir.mkdir(parents=True, exist_ok=True)
+    # Union marks must not mix with a single-profile run's in the same directory
+    state_path = data_dir / (f"profiles-{STATE_PATH.name}" if profiles else STATE_PATH.name)
+    report_path = args.report or data_dir / REPORT_PATH
+
+    global STATE
+    windows = {}
+    if args.full:
+        STATE = FetchState()
+    elif profiles:
+        windows = {name: read_json(data_dir / name / "latest.json") for name in profiles}
+        # Marks only hold while every profile still has the window they were taken with
+        STATE = (FetchState(read_json(state_path), merge_windows(windows.values()))
+                 if all(windows.values()) else FetchState())
+    else:
+        STATE = FetchState.load(state_path, data_dir / "latest.json")
+
+    if args.record or args.replay:
+        http_client.enable_fixtures(args.record or args.replay, "record" if args.record else "replay")
+    if args.standin:
+        http_client.route_to_standin(args.standin)
+    if not args.no_cache:
+        http_client.enable_cache()
+
+    print(f"\n{'='*60}")
+    print(f"  Research Radar — {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    print(f"{'='*60}\n")
+
+    sources = dict(SOURCES)
+    if args.arxiv_per_keyword:
+        sources["arxiv"] = fetch_arxiv_per_keyword
+    fetched = run_sources(sources, serial=args.serial)
+
+    if profiles:
+        outputs = {}
+        for name, profile in profiles.items():
+            print(f"\n👤 Profile {name}")
+            selected = select_items(fetched, STATE.hits, profile, windows.get(name, {}))
+            selected["faculty_jobs"] = fetched["faculty_jobs"]
+            outputs[name] = write_run(selected, profile, data_dir / name, profile=name)
+    else:
+        outputs = {None: write_run(fetched, cfg, data_dir)}
+
+    # Marks are saved last so they never run ahead of the data on disk
+    STATE.save(state_path)
+
+    report = telemetry.write_report(report_path, args.trace)
+    print("\n⏱  Time by source (wall / in requests / sleeping):")
+    for name, stats in report["sources"].items():
+        print(f"   {name:<18} {stats.get('wall', 0):6.1f}s {stats['total']:6.1f}s {stats['sleep']:6.1f}s"
+              f"  {stats['requests']} requests, {stats['cache_hits']} cached")
+
+    for name, (all_data, output_path) in outputs.items():
+        total = sum(len(all_data[k]) for k in ["arxiv", "semantic_scholar", "hackernews", "reddit", "bluesky"])
+        profile = f" ({name})" if name else ""
+        print(f"\n✅ Done{profile}! Total items: {total}")
+        print(f"   Output: {output_path}")
+    print(f"   Run report: {report_path}")
 
 
 if __name__ == "__main__":
@@ -4,59 +4,70 @@ Fetch faculty job postings from sources with working APIs/feeds.
 Sources: GitHub CS faculty job wikis, RSS feeds that work, curated boards.
 """
 
-import json
-import urllib.request
-import urllib.parse
 import re
 from datetime import datetime
-from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).parent.parent
-DATA_DIR = PROJECT_ROOT / "docs" / "data"
+import http_client
+from html_tables import iter_table_rows
+from keyword_matcher import KeywordMatcher
+from output import merge_into_latest
 
 HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"}
 
-KEYWORDS_RE = re.compile(
-    r"human.?computer|HCI|artificial.?intelligence|machine.?learning|NLP|natural.?language|"
-    r"software.?engineering|data.?science|computer.?science|interactive|UX|human.?AI|"
-    r"information.?science|intelligent.?systems",
-    re.IGNORECASE
-)
+
+def _spellings(first, second):
+    # Other separators (Human–Computer, Human/AI, Machine_Learning) become
+    # a space in `field_match` before matching
+    return [f"{first} {second}", f"{first}{second}"]
+
+
+FIELD_MATCHER = KeywordMatcher([
+    *_spellings("human", "computer"), "HCI", *_spellings("artificial", "intelligence"),
+    *_spellings("machine", "learning"), "NLP", *_spellings("natural", "language"),
+    *_spellings("software", "engineering"), *_spellings("data", "science"),
+    *_spellings("computer", "science"), "interactive", "UX", *_spellings("human", "AI"),
+    *_spellings("information", "science"), *_spellings("intelligent", "systems"),
+])
+_SEPARATORS = re.compile(r"[^0-9A-Za-z]+")
+
+
+def field_match(text):
+    """True if `text` mentions one of our fields, whatever separates the words."""
+    return FIELD_MATCHER.search(_SEPARATORS.sub(" ", text))
 
 
 def fetch_url(url, timeout=15):
-    req = urllib.request.Request(url, headers=HEADERS)
     try:
-        with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+        return http_client.get(url, headers=HEADERS, timeout=timeout).text(errors="replace")
     except Exception as e:
         print(f"  ⚠ Failed: {url}: {e}")
         return None
 
 
+REGION_CHECKS = [
+    ("🇺🇸 US", ["united states", "usa", " us,", "california", "new york", "texas", "massachusetts",
+                  "georgia", "illinois", "washington", "virginia", "pennsylvania", "ohio", "michigan",
+                  "carnegie mellon", "mit ", "stanford", "berkeley", "cornell", "georgia tech",
+                  "purdue", "umich", "ucla", "uiuc"]),
+    ("🇬🇧 UK", ["united kingdom", " uk,", " uk ", "england", "london", "oxford", "cambridge", "imperial college", "edinburgh"]),
+    ("🇨🇦 Canada", ["canada", "toronto", "waterloo", "montreal", "vancouver", "british columbia"]),
+    ("🇩🇪 Germany", ["germany", "munich", "berlin", "max planck"]),
+    ("🇨🇭 Switzerland", ["switzerland", "zurich", "eth ", "epfl"]),
+    ("🇳🇱 Netherlands", ["netherlands", "amsterdam", "delft", "eindhoven", "twente"]),
+    ("🇸🇬 Singapore", ["singapore", "nus ", "ntu ", "smu ", "sutd"]),
+    ("🇭🇰 Hong Kong", ["hong kong", "hku", "cuhk", "hkust", "polyu", "cityu"]),
+    ("🇦🇺 Australia", ["australia", "sydney", "melbourne", "queensland", "monash"]),
+    ("🇪🇺 Europe", ["europe", "france", "italy", "spain", "sweden", "denmark", "norway", "finland"]),
+    ("🌏 Asia", ["china", "japan", "korea", "taiwan", "india", "beijing", "shanghai", "tokyo", "seoul"]),
+]
+REGION_RANK = {kw: rank for rank, (_, keywords) in enumerate(REGION_CHECKS) for kw in keywords}
+REGION_MATCHER = KeywordMatcher(REGION_RANK)
+
+
 def detect_region(text):
-    text_lower = text.lower()
-    checks = [
-        ("🇺🇸 US", ["united states", "usa", " us,", "california", "new york", "texas", "massachusetts",
-                      "georgia", "illinois", "washington", "virginia", "pennsylvania", "ohio", "michigan",
-                      "carnegie mellon", "mit ", "stanford", "berkeley", "cornell", "georgia tech",
-                      "purdue", "umich", "ucla", "uiuc"]),
-        ("🇬🇧 UK", ["united kingdom", " uk,", " uk ", "england", "london", "oxford", "cambridge", "imperial college", "edinburgh"]),
-        ("🇨🇦 Canada", ["canada", "toronto", "waterloo", "montreal", "vancouver", "british columbia"]),
-        ("🇩🇪 Germany", ["germany", "munich", "berlin", "max planck"]),
-        ("🇨🇭 Switzerland", ["switzerland", "zurich", "eth ", "epfl"]),
-        ("🇳🇱 Netherlands", ["netherlands", "amsterdam", "delft", "eindhoven", "twente"]),
-        ("🇸🇬 Singapore", ["singapore", "nus ", "ntu ", "smu ", "sutd"]),
-        ("🇭🇰 Hong Kong", ["hong kong", "hku", "cuhk", "hkust", "polyu", "cityu"]),
-        ("🇦🇺 Australia", ["australia", "sydney", "melbourne", "queensland", "monash"]),
-        ("🇪🇺 Europe", ["europe", "france", "italy", "spain", "sweden", "denmark", "norway", "finland"]),
-        ("🌏 Asia", ["china", "japan", "korea", "taiwan", "india", "beijing", "shanghai", "tokyo", "seoul"]),
-    ]
-    for region, keywords in checks:
-        for kw in keywords:
-            if kw in text_lower:
-                return region
-    return "🌐 Global"
+    # Earlier regions in REGION_CHECKS win when several match
+    ranks = [REGION_RANK[kw] for kw in REGION_MATCHER.matched(text)]
+    return REGION_CHECKS[min(ranks)][0] if ranks else "🌐 Global"
 
 
 def fetch_github_cs_wiki():
@@ -108,7 +119,7 @@ def fetch_github_cs_wiki():
             region = detect_region(full_text)
             
             # Filter for relevant areas
-            if not KEYWORDS_RE.search(full_text) and "cs" not in area.lower():
+            if not field_match(full_text) and "cs" not in area.lower():
                 continue
             
             summary = f"{area}" + (f" | Deadline: {deadline}" if deadline else "")
@@ -131,46 +142,45 @@ def fetch_github_cs_wiki():
 
 
 def fetch_csrankings_jobs():
-    """Fetch from CSRankings job board."""
+    """Fetch from CSRankings job board, parsing the table as the page arrives."""
     print("📡 Fetching CSRankings Jobs...")
     url = "https://drafty.cs.brown.edu/csopenpositions/"
-    content = fetch_url(url)
-    if not content:
+    try:
+        jobs = parse_csrankings_jobs(http_client.iter_text(url, headers=HEADERS, timeout=15))
+    except Exception as e:
+        print(f"  ⚠ Failed: {url}: {e}")
         return []
-    
+
+    print(f"  ✓ CSRankings: {len(jobs)} jobs")
+    return jobs
+
+
+def parse_csrankings_jobs(chunks):
+    """Job records from the drafty open-positions HTML table, given as text chunks."""
     jobs = []
-    # Parse the HTML table
-    rows = re.findall(r'<tr[^>]*>(.*?)</tr>', content, re.DOTALL)
-    for row in rows:
-        cells = re.findall(r'<td[^>]*>(.*?)</td>', row, re.DOTALL)
+    ts = int(datetime.now().timestamp())
+    for row in iter_table_rows(chunks):
+        cells = row.cells
         if len(cells) < 3:
             continue
-        
-        # Clean HTML
-        def clean(s):
-            return re.sub(r'<[^>]+>', '', s).strip()
-        
-        institution = clean(cells[0])
+
+        institution = cells[0]
         if "institution" in institution.lower() or not institution:
             continue
-        
-        # Find link
-        link_match = re.search(r'href="([^"]+)"', row)
-        link = link_match.group(1) if link_match else ""
-        
-        area = clean(cells[1]) if len(cells) > 1 else ""
-        rank = clean(cells[2]) if len(cells) > 2 else ""
-        deadline = clean(cells[3]) if len(cells) > 3 else ""
-        
+
+        link = row.links[0] if row.links else ""
+        area, rank = cells[1], cells[2]
+        deadline = cells[3] if len(cells) > 3 else ""
+
         full_text = f"{institution} {area} {rank}"
         region = detect_region(full_text)
-        
+
         summary = f"{rank} position" if rank else "Faculty position"
         if area:
             summary += f" in {area}"
         if deadline:
             summary += f" | Deadline: {deadline}"
-        
+
         jobs.append({
             "title": f"{institution} — {summary[:80]}",
             "link": link if link.startswith("http") else f"https://drafty.cs.brown.edu{link}" if link else "https://drafty.cs.brown.edu/csopenpositions/",
@@ -178,10 +188,9 @@ def fetch_csrankings_jobs():
             "summary": summary[:300],
             "region": region,
             "origin": "CSRankings",
-            "ts": int(datetime.now().timestamp()),
+            "ts": ts,
         })
-    
-    print(f"  ✓ CSRankings: {len(jobs)} jobs")
+
     return jobs
 
 
@@ -271,7 +280,8 @@ def deduplicate(jobs):
     return unique
 
 
-def main():
+def collect_jobs():
+    """Fetch, deduplicate and sort all faculty jobs (nothing is written)."""
     print("🎓 Fetching Faculty Job Postings...\n")
     
     all_jobs = []
@@ -300,15 +310,17 @@ def main():
     for r, c in sorted(regions.items(), key=lambda x: -x[1]):
         print(f"  {r}: {c}")
     
-    # Update latest.json
-    latest_path = DATA_DIR / "latest.json"
-    data = json.loads(latest_path.read_text()) if latest_path.exists() else {}
-    data["faculty_jobs"] = all_jobs
-    latest_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
-    
+    return all_jobs
+
+
+def main():
+    """Standalone run: merge fresh faculty jobs into the existing latest.json."""
+    all_jobs = collect_jobs()
+    latest_path = merge_into_latest("faculty_jobs", all_jobs)
     print(f"\n📁 Saved to {latest_path}")
     return all_jobs
 
 
 if __name__ == "__main__":
+    http_client.enable_cache()
     main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Streaming HTML table extraction for Research Radar's scrapers.
+A single html.parser pass turns <tr> rows into cell texts and links as
+the markup is fed in, chunk by chunk, so rows can be consumed before the
+whole page has been parsed. Tolerates the usual sloppy HTML: omitted
+</td> / </tr>, nested tables, entities, scripts inside cells.
+"""
+
+from collections import namedtuple
+from html.parser import HTMLParser
+
+# `table` numbers tables in document order; `cells` holds <td> texts and
+# `headers` <th> texts, both whitespace-collapsed; `links` are the row's
+# hrefs in order, and `cell_links` the hrefs inside each <td>.
+TableRow = namedtuple("TableRow", "table cells headers links cell_links")
+
+CHUNK_SIZE = 64 * 1024
+
+_SKIP_TEXT = {"script", "style", "template"}
+
+
+class _Table:
+    __slots__ = ("index", "row", "cell")
+
+    def __init__(self, index):
+        self.index = index
+        self.row = None   # {"cells": [...], "headers": [...], "links": [...], "cell_links": [...]}
+        self.cell = None  # (kind, [text parts], [links])
+
+
+class TableExtractor(HTMLParser):
+    """Incremental <table> parser; call `feed` repeatedly and `pop_rows` for finished rows."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._tables = []
+        self._count = 0
+        self._skip = 0
+        self._rows = []
+
+    def pop_rows(self):
+        """Rows completed since the last call."""
+        rows, self._rows = self._rows, []
+        return rows
+
+    # Cell and row bookkeeping
+
+    def _close_cell(self, table):
+        if table.cell is None:
+            return
+        kind, parts, links = table.cell
+        text = " ".join("".join(parts).split())
+        if kind == "td":
+            table.row["cells"].append(text)
+            table.row["cell_links"].append(links)
+        else:
+            table.row["headers"].append(text)
+        table.cell = None
+
+    def _close_row(self, table):
+        self._close_cell(table)
+        row = table.row
+        if row is not None and (row["cells"] or row["headers"]):
+            self._rows.append(TableRow(table.index, row["cells"], row["headers"],
+                                       row["links"], row["cell_links"]))
+        table.row = None
+
+    def _open_row(self, table):
+        table.row = {"cells": [], "headers": [], "links": [], "cell_links": []}
+
+    # HTMLParser callbacks
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TEXT:
+            self._skip += 1
+            return
+        if tag == "table":
+            self._tables.append(_Table(self._count))
+            self._count += 1
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        if tag == "tr":
+            self._close_row(table)
+            self._open_row(table)
+        elif tag in ("td", "th"):
+            if table.row is None:
+                self._open_row(table)
+            self._close_cell(table)
+            table.cell = (tag, [], [])
+        elif tag == "a" and table.row is not None:
+            href = dict(attrs).get("href")
+            if href:
+                table.row["links"].append(href)
+                if table.cell is not None:
+                    table.cell[2].append(href)
+        elif tag == "br" and table.cell is not None:
+            table.cell[1].append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TEXT:
+            self._skip = max(0, self._skip - 1)
+            return
+        if not self._tables:
+            return
+        table = self._tables[-1]
+        if tag == "table":
+            self._close_row(table)
+            self._tables.pop()
+        elif tag == "tr":
+            self._close_row(table)
+        elif tag in ("td", "th"):
+            self._close_cell(table)
+
+    def handle_data(self, data):
+        if self._skip or not self._tables:
+            return
+        cell = self._tables[-1].cell
+        if cell is not None:
+            cell[1].append(data)
+
+    def close(self):
+        super().close()
+        while self._tables:
+            self._close_row(self._tables.pop())
+
+
+def iter_table_rows(chunks):
+    """Yield TableRows from an iterable of HTML text chunks, as soon as each row ends."""
+    parser = TableExtractor()
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from parser.pop_rows()
+    parser.close()
+    yield from parser.pop_rows()
+
+
+def chunked(text, size=CHUNK_SIZE):
+    """Split an already-downloaded page into chunks for `iter_table_rows`
+    (a live response streams with http_client.iter_text instead)."""
+    for start in range(0, len(text), size):
+        yield text[start:start + size]
@@ -0,0 +1,834 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP plumbing for the Research Radar fetchers.
+Per-host token buckets keep each API's request spacing fixed, so the
+sources can run concurrently without being any less polite, a
+keep-alive connection pool saves a TCP+TLS handshake on every request,
+and an optional on-disk cache turns unchanged payloads into 304s.
+Failures are classified: transient ones are retried with jittered
+exponential backoff that honours Retry-After, and a per-host circuit
+breaker stops a host that is down from stalling the rest of the run.
+Every request's timings are handed to `telemetry` for the run report.
+Responses can be recorded as fixtures and replayed offline, or served by
+a local stand-in server (see standin_server.py). Large pages that are
+parsed incrementally can be streamed with `iter_text` instead of `get`.
+"""
+
+import base64
+import codecs
+import contextlib
+import email.utils
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import random
+import socket
+import ssl
+import threading
+import time
+import urllib.parse
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+
+import telemetry
+
+# Requests per second allowed for each host (the old per-source sleeps)
+HOST_RATES = {
+    "export.arxiv.org": 1 / 3,        # arXiv asks for 3s between calls
+    "api.semanticscholar.org": 1.0,
+    "hn.algolia.com": 2.0,
+    "www.reddit.com": 0.5,
+    "public.api.bsky.app": 2.0,
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at `rate` tokens per second."""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until it is available. Returns seconds slept."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Going negative reserves a future slot for this caller
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def defer(self, seconds):
+        """Hold every caller back for at least `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def get_bucket(host):
+    """Return the shared bucket for `host`, or None if the host is unthrottled."""
+    rate = HOST_RATES.get(host)
+    if rate is None:
+        return None
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(rate)
+        return _buckets[host]
+
+
+def throttle(url):
+    """Block until the rate limiter for `url`'s host allows another request."""
+    if FIXTURES is not None and FIXTURES.mode == "replay":
+        return 0.0
+    bucket = get_bucket(urllib.parse.urlsplit(url).hostname or "")
+    return bucket.acquire() if bucket else 0.0
+
+
+# ─── Connection pool ─────────────────────────────────────────────────────────
+
+MAX_IN_FLIGHT_PER_HOST = 4
+MAX_REDIRECTS = 5
+
+# Loading the CA store takes tens of ms, so it waits for the first HTTPS connect
+_ssl_context = None
+_ssl_context_lock = threading.Lock()
+
+
+def ssl_context():
+    """The shared TLS context, created on first use."""
+    global _ssl_context
+    if _ssl_context is None:
+        with _ssl_context_lock:
+            if _ssl_context is None:
+                _ssl_context = ssl.create_default_context()
+    return _ssl_context
+
+
+class HTTPError(Exception):
+    """Non-2xx response that was not a followable redirect."""
+
+    def __init__(self, url, status, reason="", headers=None):
+        super().__init__(f"HTTP {status} {reason}".strip())
+        self.url = url
+        self.status = status
+        self.headers = headers or {}  # lower-cased names
+
+
+class Response:
+    """Fully-read HTTP response."""
+
+    def __init__(self, url, status, headers, body):
+        self.url = url
+        self.status = status
+        self.headers = headers  # lower-cased names
+        self.body = body
+
+    def text(self, errors="strict"):
+        return self.body.decode("utf-8", errors=errors)
+
+
+def _decode_body(body, encoding):
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        return zlib.decompress(body)
+    return body
+
+
+def _timed_create_connection(address, timeout, source_address, timing):
+    """socket.create_connection, with DNS and TCP connect timed separately."""
+    host, port = address
+    start = time.perf_counter()
+    infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+    resolved = time.perf_counter()
+    timing["dns"] = timing.get("dns", 0.0) + resolved - start
+    error = None
+    for family, socktype, proto, _, sockaddr in infos:
+        sock = socket.socket(family, socktype, proto)
+        try:
+            sock.settimeout(timeout)
+            if source_address:
+                sock.bind(source_address)
+            sock.connect(sockaddr)
+            timing["connect"] = timing.get("connect", 0.0) + time.perf_counter() - resolved
+            return sock
+        except OSError as exc:
+            error = exc
+            sock.close()
+    raise error or OSError(f"getaddrinfo returned nothing for {host}")
+
+
+def _add(timing, key, seconds):
+    timing[key] = timing.get(key, 0.0) + seconds
+
+
+class ConnectionPool:
+    """Keep-alive connections reused per (scheme, host, port).
+
+    At most `max_per_host` requests are in flight to any one host; the idle
+    connections they leave behind are handed to the next caller.
+    """
+
+    def __init__(self, max_per_host=MAX_IN_FLIGHT_PER_HOST):
+        self.max_per_host = max_per_host
+        self._idle = {}
+        self._slots = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, key):
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return self._slots[key]
+
+    def _checkout(self, key, timeout, fresh):
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(key)
+                if idle:
+                    conn = idle.pop()
+                    conn.timeout = timeout
+                    if conn.sock:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=timeout, context=ssl_context())
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        return conn, False
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    @contextlib.contextmanager
+    def open(self, method, url, headers, timeout, body=None, timing=None):
+        """Send one request and yield the http.client response, body unread
+        (no redirects, no retries).
+
+        The host's slot is held until the block exits; the connection then
+        goes back to the pool if the body was read to the end, and is
+        closed otherwise. Phase durations in seconds (queued, dns, connect,
+        tls, ttfb, total) are added to `timing` if given.
+        """
+        timing = {} if timing is None else timing
+        parts = urllib.parse.urlsplit(url)
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        start = time.perf_counter()
+        with self._slot(key):
+            _add(timing, "queued", time.perf_counter() - start)
+            # A reused connection may have been closed by the server while idle;
+            # that failure gets one immediate retry on a fresh connection.
+            for fresh in (False, True):
+                conn, reused = self._checkout(key, timeout, fresh)
+                timing["reused"] = reused
+                try:
+                    if not reused:
+                        conn._create_connection = (
+                            lambda address, timeout, source_address=None:
+                            _timed_create_connection(address, timeout, source_address, timing))
+                        before = timing.get("dns", 0.0) + timing.get("connect", 0.0)
+                        connect_start = time.perf_counter()
+                        conn.connect()
+                        if parts.scheme == "https":
+                            socket_time = timing.get("dns", 0.0) + timing.get("connect", 0.0) - before
+                            _add(timing, "tls", time.perf_counter() - connect_start - socket_time)
+                    sent = time.perf_counter()
+                    conn.request(method, path, body=body, headers=headers)
+                    resp = conn.getresponse()
+                    _add(timing, "ttfb", time.perf_counter() - sent)
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+                except Exception:
+                    conn.close()
+                    raise
+                break
+            try:
+                yield resp
+            except BaseException:
+                conn.close()
+                raise
+            if resp.will_close or not resp.isclosed():
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            _add(timing, "total", time.perf_counter() - start)
+
+    def request(self, method, url, headers, timeout, body=None, timing=None):
+        """Send one request and read the whole response (no redirects, no retries).
+
+        Timings as for `open`, plus the raw byte count.
+        """
+        timing = {} if timing is None else timing
+        with self.open(method, url, headers, timeout, body, timing) as resp:
+            body = resp.read()
+        timing["bytes"] = timing.get("bytes", 0) + len(body)
+        resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+        body = _decode_body(body, resp_headers.get("content-encoding", ""))
+        return Response(url, resp.status, resp_headers, body)
+
+    def close(self):
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+POOL = ConnectionPool()
+
+
+def _send(method, url, headers, timeout, body=None, timing=None):
+    """Send a request, following redirects. Raises HTTPError on non-2xx.
+
+    With fixtures enabled, a replay answers from disk and a recording
+    saves the final response under the URL that was asked for.
+    """
+    fixtures = FIXTURES
+    if fixtures is not None and fixtures.mode == "replay":
+        resp = fixtures.load(method, url, body)
+        if resp is None:
+            raise HTTPError(url, 404, "no recorded fixture")
+        if timing is not None:
+            timing["bytes"] = timing.get("bytes", 0) + len(resp.body)
+        if not 200 <= resp.status < 300:
+            raise HTTPError(url, resp.status, "recorded", resp.headers)
+        return resp
+
+    requested_method, requested, request_body = method, url, body
+    for _ in range(MAX_REDIRECTS + 1):
+        if STANDIN:
+            # The stand-in server picks the response from the original URL
+            resp = POOL.request(method, STANDIN, {**headers, STANDIN_HEADER: url}, timeout, body, timing)
+        else:
+            resp = POOL.request(method, url, headers, timeout, body, timing)
+        location = resp.headers.get("location")
+        if resp.status in (301, 302, 303, 307, 308) and location:
+            if timing is not None:
+                timing["redirects"] = timing.get("redirects", 0) + 1
+            url = urllib.parse.urljoin(url, location)
+            if resp.status in (301, 302, 303):
+                method, body = "GET", None
+            continue
+        if fixtures is not None and resp.status != 304:
+            fixtures.save(requested_method, requested, request_body, resp)
+        if resp.status == 304:
+            return resp
+        if not 200 <= resp.status < 300:
+            raise HTTPError(url, resp.status, http.client.responses.get(resp.status, ""), resp.headers)
+        return resp
+    raise HTTPError(url, resp.status, "too many redirects")
+
+
+# ─── Fixtures and stand-in server ─────────────────────────────────────────────
+
+STANDIN = None                   # base URL of a stand-in server, if routing there
+STANDIN_HEADER = "X-Standin-Url"
+
+
+class FixtureStore:
+    """Recorded responses keyed by method, URL and request body.
+
+    Each lives in `<directory>/<host>/<sha1>.json`. In "replay" mode,
+    `fallback(method, url, body)` may synthesize a Response for requests
+    that were never recorded (with no directory, for every request).
+    """
+
+    def __init__(self, directory, mode="replay", fallback=None):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"unknown fixture mode {mode!r}")
+        self.directory = Path(directory) if directory else None
+        self.mode = mode
+        self.fallback = fallback
+        self._lock = threading.Lock()
+
+    def path(self, method, url, body=None):
+        key = f"{method} {url}\n".encode("utf-8") + (body or b"")
+        host = urllib.parse.urlsplit(url).hostname or "unknown"
+        return self.directory / host / f"{hashlib.sha1(key).hexdigest()}.json"
+
+    def load(self, method, url, body=None):
+        if self.directory is None:
+            return self.fallback(method, url, body) if self.fallback else None
+        try:
+            data = json.loads(self.path(method, url, body).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self.fallback(method, url, body) if self.fallback else None
+        if data.get("encoding") == "base64":
+            payload = base64.b64decode(data["body"])
+        else:
+            payload = data["body"].encode("utf-8")
+        return Response(url, data["status"], data["headers"], payload)
+
+    def save(self, method, url, body, resp):
+        try:
+            text, encoding = resp.body.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            text, encoding = base64.b64encode(resp.body).decode("ascii"), "base64"
+        data = {
+            "method": method,
+            "url": url,
+            "request_body": body.decode("utf-8", errors="replace") if body else None,
+            "status": resp.status,
+            "headers": {k: v for k, v in resp.headers.items()
+                        if k not in ("content-encoding", "content-length", "transfer-encoding")},
+            "encoding": encoding,
+            "body": text,
+        }
+        path = self.path(method, url, body)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp, path)
+
+
+FIXTURES = None
+
+
+def enable_fixtures(directory, mode="replay", fallback=None):
+    """Record every response to `directory`, or replay from it without any network."""
+    global FIXTURES
+    FIXTURES = FixtureStore(directory, mode, fallback)
+    return FIXTURES
+
+
+def route_to_standin(base_url):
+    """Send every request to the stand-in server at `base_url` instead of the real host."""
+    global STANDIN
+    STANDIN = base_url
+
+
+# ─── Conditional-request cache ───────────────────────────────────────────────
+
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "http"
+DEFAULT_CACHE_TTL = 14 * 86400          # drop entries not revalidated in two weeks
+DEFAULT_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+
+class ResponseCache:
+    """On-disk response bodies plus their ETag / Last-Modified validators.
+
+    Each URL maps to `<sha1>.json` (validators and bookkeeping) and
+    `<sha1>.body`. Entries are always revalidated; a 304 reuses the body.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_CACHE_TTL, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _paths(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json", self.directory / f"{digest}.body"
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def lookup(self, url):
+        """Return the cached entry for `url` (meta dict with `body`), or None."""
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta["body"] = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if meta.get("url") != url or time.time() - meta.get("validated_at", 0) > self.ttl:
+            return None
+        return meta
+
+    def store(self, url, resp):
+        """Remember `resp` if the server gave us something to revalidate with."""
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": {k: v for k, v in resp.headers.items()
+                        if k not in ("content-encoding", "content-length")},
+            "size": len(resp.body),
+            "validated_at": time.time(),
+        }
+        with self._lock:
+            self._write_atomic(body_path, resp.body)
+            self._write_atomic(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def touch(self, url, entry):
+        """Record a successful revalidation (304) of `entry`."""
+        meta = {k: v for k, v in entry.items() if k != "body"}
+        meta["validated_at"] = time.time()
+        with self._lock:
+            self._write_atomic(self._paths(url)[0], json.dumps(meta).encode("utf-8"))
+
+    def evict(self):
+        """Drop expired entries, then least recently validated ones over `max_bytes`."""
+        with self._lock:
+            entries = []
+            for meta_path in self.directory.glob("*.json"):
+                body_path = meta_path.with_suffix(".body")
+                try:
+                    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    meta = {}
+                entries.append((meta.get("validated_at", 0), meta.get("size", 0), meta_path, body_path))
+            entries.sort(key=lambda e: e[0], reverse=True)
+            now = time.time()
+            total = 0
+            for validated_at, size, meta_path, body_path in entries:
+                total += size
+                if now - validated_at > self.ttl or total > self.max_bytes:
+                    meta_path.unlink(missing_ok=True)
+                    body_path.unlink(missing_ok=True)
+
+
+CACHE = None
+
+
+def enable_cache(directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_CACHE_TTL, max_bytes=DEFAULT_CACHE_MAX_BYTES):
+    """Turn on the conditional-request cache for every `get` in this process."""
+    global CACHE
+    CACHE = ResponseCache(directory, ttl=ttl, max_bytes=max_bytes)
+    CACHE.evict()
+    return CACHE
+
+
+def _conditional_headers(headers, entry):
+    headers = dict(headers)
+    if entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+# ─── Retries and circuit breakers ────────────────────────────────────────────
+
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+BACKOFF_CAP = 30             # seconds; exponential backoff never sleeps longer
+MAX_RETRY_AFTER = 120        # a server asking for a longer pause gets no retry
+BREAKER_THRESHOLD = 5        # consecutive host failures that open the circuit
+BREAKER_COOLDOWN = 120       # seconds before a single trial request is let through
+
+
+class CircuitOpenError(Exception):
+    """Raised without sending anything while a host's circuit is open."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"circuit open for {host} (retry in {retry_in:.0f}s)")
+        self.host = host
+
+
+def classify(exc):
+    """Return (retryable, host_failure) for an exception raised by a request.
+
+    Timeouts, dropped connections and 5xx count against the host and are
+    retried; 408/425/429 are retried but say nothing about the host's
+    health; other 4xx, TLS certificate problems and bad payloads are final.
+    """
+    if isinstance(exc, CircuitOpenError):
+        return False, False
+    if isinstance(exc, HTTPError):
+        return exc.status in RETRYABLE_STATUS, exc.status >= 500
+    if isinstance(exc, (ssl.SSLCertVerificationError, ssl.CertificateError)):
+        return False, False
+    if isinstance(exc, (OSError, http.client.HTTPException, EOFError)):
+        return True, True
+    return False, False
+
+
+def retry_after_seconds(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt, base, cap=BACKOFF_CAP):
+    """Full-jitter exponential backoff after the `attempt`-th failure (0-based)."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host breaker: closed, open after `threshold` straight failures, then half-open.
+
+    While open, requests fail immediately. After `cooldown` seconds one
+    trial request is allowed; its success closes the circuit, its failure
+    (or an error that says nothing about the host) opens it again.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Return 0 if a request may go out, else the seconds until the next trial."""
+        with self._lock:
+            if self.opened_at is None:
+                return 0
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining <= 0 and not self._trial:
+                self._trial = True
+                return 0
+            return max(remaining, 1)
+
+    def success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial or self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+                self._trial = False
+
+    def inconclusive(self):
+        """Settle an attempt whose error is not the host's: a pending trial counts as failed."""
+        with self._lock:
+            if self._trial:
+                self.opened_at = time.monotonic()
+                self._trial = False
+
+
+_breakers = {}
+
+
+def get_breaker(host):
+    with _buckets_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker()
+        return _breakers[host]
+
+
+class _Attempt:
+    """Times one attempt (rate-limit sleep included) and reports it to telemetry."""
+
+    def __init__(self, method, url, attempt, backoff):
+        self.record = {"method": method, "url": url, "host": urllib.parse.urlsplit(url).hostname,
+                       "attempt": attempt, "start": telemetry.now()}
+        if backoff:
+            self.record["backoff"] = backoff
+        self.timing = {}
+        self.record["sleep"] = throttle(url)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None and exc_type is not GeneratorExit:  # a stream closed early is fine
+            self.record["error"] = f"{exc_type.__name__}: {exc}"
+            self.record["status"] = getattr(exc, "status", None)
+        telemetry.record_request({**self.record, **self.timing})
+        return False
+
+
+def _settle(breaker, exc):
+    """Report a failed attempt to the host's breaker; True if `exc` is worth retrying."""
+    retryable, host_failure = classify(exc)
+    if host_failure:
+        breaker.failure()
+    elif isinstance(exc, HTTPError):
+        breaker.success()  # the host answered
+    else:
+        breaker.inconclusive()  # e.g. a corrupt body; never leave a trial pending
+    return retryable
+
+
+def _open_breaker(method, url, attempt=1):
+    """The host's breaker; raises CircuitOpenError (and records it) while it is open."""
+    host = urllib.parse.urlsplit(url).hostname or ""
+    breaker = get_breaker(host)
+    retry_in = breaker.allow()
+    if retry_in:
+        exc = CircuitOpenError(host, retry_in)
+        telemetry.record_request({"method": method, "url": url, "host": host, "attempt": attempt,
+                                  "start": telemetry.now(), "error": f"CircuitOpenError: {exc}"})
+        raise exc
+    return breaker
+
+
+def _with_retries(method, url, attempt_fn, max_retries, delay):
+    """Run `attempt_fn(attempt)` until it succeeds, under the retry policy.
+
+    Final errors are raised at once; retryable ones are retried up to
+    `max_retries` attempts in total after a full-jitter exponential
+    backoff (base `delay`). A Retry-After answer pauses the whole host's
+    rate limiter, or this caller when the host has none. Failures that
+    point at the host feed its circuit breaker.
+    """
+    host = urllib.parse.urlsplit(url).hostname or ""
+    backoff = 0.0
+    for attempt in range(max_retries):
+        breaker = _open_breaker(method, url, attempt + 1)
+        try:
+            with _Attempt(method, url, attempt + 1, backoff) as a:
+                result = attempt_fn(a)
+            breaker.success()
+            return result
+        except Exception as exc:
+            retryable = _settle(breaker, exc)
+            if not retryable or attempt == max_retries - 1:
+                raise
+            backoff = backoff_delay(attempt, delay)
+            retry_after = retry_after_seconds(getattr(exc, "headers", {}).get("retry-after"))
+            if retry_after is not None:
+                if retry_after > MAX_RETRY_AFTER:
+                    raise
+                bucket = get_bucket(host)
+                if bucket:
+                    bucket.defer(retry_after)
+                else:
+                    backoff = max(backoff, retry_after)
+            time.sleep(backoff)
+
+
+def get(url, headers=None, timeout=30, max_retries=1, delay=2):
+    """GET `url` through the shared pool with per-host rate limiting.
+
+    Up to `max_retries` attempts in total, under the retry policy above;
+    the last error is re-raised. With the cache enabled, a 304 answer
+    returns the cached body as a 200.
+    """
+    headers = dict(headers or {})
+    headers.setdefault("Accept-Encoding", "gzip")
+    # Recorded or stand-in responses never go through the cache
+    cache = CACHE if FIXTURES is None and STANDIN is None else None
+    entry = cache.lookup(url) if cache else None
+    if entry:
+        headers = _conditional_headers(headers, entry)
+
+    def attempt(a):
+        resp = _send("GET", url, headers, timeout, timing=a.timing)
+        a.record["status"] = resp.status
+        if resp.status == 304:
+            if not entry:
+                raise HTTPError(url, 304, "Not Modified without a cached entry")
+            a.record["cache"] = "revalidated"
+            cache.touch(url, entry)
+            return Response(url, 200, entry["headers"], entry["body"])
+        if cache:
+            a.record["cache"] = "miss"
+            cache.store(url, resp)
+        return resp
+
+    return _with_retries("GET", url, attempt, max_retries, delay)
+
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _stream_body(url, headers, timeout, chunk_size, errors, a):
+    """Follow redirects, then yield the final response body as decoded text chunks."""
+    timing = a.timing
+    for _ in range(MAX_REDIRECTS + 1):
+        with POOL.open("GET", url, headers, timeout, timing=timing) as resp:
+            location = resp.getheader("location")
+            if resp.status in (301, 302, 303, 307, 308) and location:
+                timing["redirects"] = timing.get("redirects", 0) + 1
+                url = urllib.parse.urljoin(url, location)
+                continue
+            a.record["status"] = resp.status
+            if not 200 <= resp.status < 300:
+                raise HTTPError(url, resp.status, resp.reason, {k.lower(): v for k, v in resp.getheaders()})
+            # MAX_WBITS | 32 reads both gzip and zlib ("deflate") streams
+            encoding = (resp.getheader("content-encoding") or "").lower()
+            inflate = zlib.decompressobj(zlib.MAX_WBITS | 32) if encoding in ("gzip", "deflate") else None
+            decoder = codecs.getincrementaldecoder("utf-8")(errors)
+            while raw := resp.read1(chunk_size):
+                timing["bytes"] = timing.get("bytes", 0) + len(raw)
+                text = decoder.decode(inflate.decompress(raw) if inflate else raw)
+                if text:
+                    yield text
+            resp.read()  # read1 leaves a Content-Length body open at its end; this closes it
+            text = decoder.decode(inflate.flush() if inflate else b"", final=True)
+            if text:
+                yield text
+            return
+    raise HTTPError(url, resp.status, "too many redirects")
+
+
+def iter_text(url, headers=None, timeout=30, chunk_size=STREAM_CHUNK_SIZE, errors="replace"):
+    """Yield the body of GET `url` as UTF-8 text, chunk by chunk, as it arrives.
+
+    For pages that are parsed incrementally (html_tables.iter_table_rows).
+    Same pool, rate limiting, circuit breaker and telemetry as `get`, but
+    a single attempt and never cached: a failure part-way through cannot
+    be retried once chunks have been handed out. Recorded or stand-in
+    responses come from `get`, cut into chunks.
+    """
+    headers = dict(headers or {})
+    headers.setdefault("Accept-Encoding", "gzip")
+    if FIXTURES is not None or STANDIN is not None:
+        text = get(url, headers=headers, timeout=timeout).text(errors=errors)
+        for start in range(0, len(text), chunk_size):
+            yield text[start:start + chunk_size]
+        return
+
+    breaker = _open_breaker("GET", url)
+    with _Attempt("GET", url, 1, 0.0) as a:
+        try:
+            yield from _stream_body(url, headers, timeout, chunk_size, errors, a)
+        except Exception as exc:
+            _settle(breaker, exc)
+            raise
+        except GeneratorExit:
+            breaker.success()  # the host answered; the reader stopped early
+            raise
+        breaker.success()
+
+
+def post_json(url, payload, headers=None, timeout=30, max_retries=1, delay=2):
+    """POST `payload` as JSON; same pooling, rate limiting and retries as `get`."""
+    headers = dict(headers or {})
+    headers.setdefault("Accept-Encoding", "gzip")
+    headers["Content-Type"] = "application/json"
+    body = json.dumps(payload).encode("utf-8")
+
+    def attempt(a):
+        resp = _send("POST", url, headers, timeout, body, timing=a.timing)
+        a.record["status"] = resp.status
+        return resp
+
+    return _with_retries("POST", url, attempt, max_retries, delay)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword matching for Research Radar.
+An Aho–Corasick automaton compiled once from a keyword list finds every
+keyword in a text in a single pass, however many keywords there are.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+
+class KeywordMatcher:
+    """Case-insensitive substring matcher for a fixed list of keywords.
+
+    Keywords keep their configured order: `matched` and `first` report them
+    in that order, which is how fetchers pick a `matched_keyword`.
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(kw for kw in keywords if kw))
+        self._lengths = [len(kw.lower()) for kw in self.keywords]
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            node = 0
+            for ch in keyword.lower():
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(index)
+
+        # Breadth-first pass: failure links, and outputs inherited through them
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+                queue.append(child)
+
+    def _scan(self, text):
+        """Yield (end_index, keyword_index) for every occurrence."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text.lower()):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for index in out[node]:
+                yield i, index
+
+    def finditer(self, text):
+        """Yield (start, keyword) for every occurrence, in text order."""
+        for end, index in self._scan(text):
+            yield end - self._lengths[index] + 1, self.keywords[index]
+
+    def find_all(self, text):
+        """Return {keyword: [start, ...]} for every keyword found, in keyword order."""
+        found = {}
+        for start, keyword in self.finditer(text):
+            found.setdefault(keyword, []).append(start)
+        return {kw: found[kw] for kw in self.keywords if kw in found}
+
+    def matched(self, text):
+        """Keywords that occur in `text`, in keyword order."""
+        hits = {index for _, index in self._scan(text)}
+        return [self.keywords[i] for i in sorted(hits)]
+
+    def first(self, text, default=None):
+        """The earliest-listed keyword that occurs in `text`."""
+        hits = {index for _, index in self._scan(text)}
+        return self.keywords[min(hits)] if hits else default
+
+    def search(self, text):
+        """True if any keyword occurs in `text` (stops at the first hit)."""
+        return next(self._scan(text), None) is not None
+
+
+@lru_cache(maxsize=None)
+def _compile(keywords):
+    return KeywordMatcher(keywords)
+
+
+def compile_keywords(keywords):
+    """Shared matcher for a keyword list, compiled on first use."""
+    return _compile(tuple(keywords))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Output stage for Research Radar.
+Fetchers hand their results back in memory and every artifact is written
+exactly once, atomically (temp file + rename), so the dashboard never
+serves a half-written file. Besides latest.json the dashboard gets a
+small manifest plus minified per-category shards it can load lazily.
+JSON files are streamed out item by item, so writing never holds a
+second, serialized copy of the run in memory. Nothing is precompressed:
+GitHub Pages gzips responses itself, and copies would only bloat the repo.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from archive_store import ArchiveStore
+from ranking import top_items
+from search_index import build_index
+from similarity import SimilarityIndex, index_dir, related_items
+from trends import update_trends
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR = PROJECT_ROOT / "docs" / "data"
+LATEST_PATH = DATA_DIR / "latest.json"
+
+STREAM_CHUNK = 64 * 1024  # characters of JSON per write
+
+# Dashboard shards: which latest.json sections each one carries
+SHARDS = {
+    "papers": ["arxiv", "semantic_scholar"],
+    "discussions": ["hackernews", "reddit", "bluesky"],
+    "links": ["blogs", "newsletters", "researchers", "seminars", "podcasts", "conferences", "opportunities"],
+    "faculty_jobs": ["faculty_jobs"],
+}
+
+
+def write_bytes_atomic(path, blob):
+    """Write `blob` next to `path`, then rename it into place."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(blob)
+    os.replace(tmp, path)
+    return path
+
+
+def iter_json(value, indent=None, depth=2, level=0):
+    """Yield the JSON text of `value` in pieces, as json.dumps would format it.
+
+    Objects and arrays down to `depth` levels are opened up; anything deeper
+    (one item of a section, one posting list) is encoded whole, so no piece
+    is bigger than a single item.
+    """
+    if depth == 0 or not isinstance(value, (dict, list)) or not value:
+        text = json.dumps(value, ensure_ascii=False, indent=indent,
+                          separators=(",", ":") if indent is None else None)
+        yield text.replace("\n", "\n" + " " * (indent * level)) if indent and level else text
+        return
+    if indent is None:
+        first, between, close, colon = "", ",", "", ":"
+    else:
+        pad = "\n" + " " * (indent * (level + 1))
+        first, between, close, colon = pad, "," + pad, "\n" + " " * (indent * level), ": "
+    is_dict = isinstance(value, dict)
+    yield "{" if is_dict else "["
+    for i, entry in enumerate(value.items() if is_dict else value):
+        sep = between if i else first
+        if is_dict:
+            key, entry = entry
+            # Non-string keys become strings, as json.dumps writes them
+            sep += json.dumps(key if isinstance(key, str) else json.dumps(key), ensure_ascii=False) + colon
+        yield sep
+        yield from iter_json(entry, indent, depth - 1, level + 1)
+    yield close + ("}" if is_dict else "]")
+
+
+def write_json_stream(path, data, indent=None):
+    """Stream `data` as JSON next to `path`, then rename it into place.
+
+    Returns (bytes written, sha1 hex digest of the JSON).
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp")
+    digest, size = hashlib.sha1(), 0
+    with open(tmp, "wb") as f:
+        pieces, buffered = [], 0
+        for piece in iter_json(data, indent):
+            pieces.append(piece)
+            buffered += len(piece)
+            if buffered >= STREAM_CHUNK:
+                chunk = "".join(pieces).encode("utf-8")
+                digest.update(chunk)
+                size += f.write(chunk)
+                pieces, buffered = [], 0
+        chunk = "".join(pieces).encode("utf-8")
+        digest.update(chunk)
+        size += f.write(chunk)
+    os.replace(tmp, path)
+    return size, digest.hexdigest()
+
+
+def write_json_atomic(path, data, indent=2):
+    """Serialize `data` next to `path`, then rename it into place."""
+    write_json_stream(path, data, indent=indent)
+    return Path(path)
+
+
+def write_dashboard(all_data, data_dir=DATA_DIR, related=None):
+    """Write the per-category shards, the search index and the manifest.
+
+    The manifest carries meta, per-section counts, each file's path and
+    content hash, and the top-ranked items, so the page can show counts
+    before any shard loads. `related` (similarity.related_items) is written
+    to related.json; without it the previous related.json stays listed.
+    """
+    data_dir = Path(data_dir)
+    shard_dir = data_dir / "shards"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    shards = {}
+    for name, keys in SHARDS.items():
+        part = {k: all_data[k] for k in keys if k in all_data}
+        size, digest = write_json_stream(shard_dir / f"{name}.json", part)
+        shards[name] = {
+            "path": f"shards/{name}.json",
+            "keys": list(part),
+            "bytes": size,
+            "hash": digest[:12],
+        }
+
+    _, digest = write_json_stream(data_dir / "search-index.json", build_index(all_data))
+    search_index = {"path": "search-index.json", "hash": digest[:12]}
+
+    if related is not None:
+        _, digest = write_json_stream(data_dir / "related.json", related)
+        related_entry = {"path": "related.json", "hash": digest[:12]}
+    else:
+        # Papers and discussions come before faculty_jobs, so their ordinals still hold
+        try:
+            previous = json.loads((data_dir / "manifest.json").read_text(encoding="utf-8"))
+            related_entry = previous.get("related")
+        except (FileNotFoundError, ValueError):
+            related_entry = None
+
+    manifest = {
+        "meta": all_data.get("meta", {}),
+        "counts": {k: len(v) for k, v in all_data.items() if isinstance(v, list)},
+        "shards": shards,
+        "search_index": search_index,
+        # Best-scored items, as search-index ordinals (see ranking.py)
+        "top": top_items(all_data),
+        "related": related_entry,
+    }
+    blob = json.dumps(manifest, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return write_bytes_atomic(data_dir / "manifest.json", blob)
+
+
+def merge_into_latest(key, value, path=LATEST_PATH):
+    """Replace one section of an existing latest.json.
+
+    Only for fetchers run on their own; a full run writes latest.json once
+    through `write_outputs`.
+    """
+    path = Path(path)
+    data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    data[key] = value
+    write_dashboard(data, path.parent)
+    return write_json_atomic(path, data)
+
+
+def write_outputs(all_data, data_dir=DATA_DIR):
+    """Write the run's artifacts: the archive entry, trends, related items, dashboard and latest.json."""
+    data_dir = Path(data_dir)
+
+    # Record the run in the deduplicated archive (rebuild any run with
+    # `python scripts/archive_store.py snapshot <date>`)
+    store_path = data_dir / "archive.json"
+    store = ArchiveStore.load(store_path)
+    store.add_run(all_data)
+    store.save(store_path)
+    update_trends(store, data_dir / "trends.json")
+
+    related = related_items(store, all_data, SimilarityIndex(index_dir(store_path)))
+    write_dashboard(all_data, data_dir, related)
+    return write_json_atomic(data_dir / "latest.json", all_data)
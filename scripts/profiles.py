@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Multi-profile runs for Research Radar.
+Several information-source.md-style files can share one fetch: their
+scan configs are merged into the union of queries (arXiv categories and
+keywords, S2 keywords and authors, HN terms, subreddits, Bluesky
+keywords and handles), every source is fetched once under that union,
+and each profile then keeps only the items its own queries returned and
+gets its own output directory. API traffic grows with the number of
+distinct queries, not with the number of profiles.
+
+Usage:
+  python scripts/fetch_all.py --profile information-source.md --profile agents.md
+  # writes docs/data/information-source/ and docs/data/agents/;
+  # the dashboard shows one with index.html?profile=agents
+"""
+
+import copy
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from config import SNAPSHOT_PATH, load_config
+from ranking import RANKED_SOURCES
+
+# Config lists that become queries; the union asks each entry once
+QUERY_LISTS = ["arxiv_categories", "arxiv_keywords", "s2_keywords", "hn_keywords",
+               "reddit_subreddits", "reddit_keywords", "bluesky_keywords", "bluesky_handles"]
+
+# Days of history a fetcher asks for, from days_lookback (the others use it as is)
+WINDOWS = {
+    "arxiv": lambda days: days + 2,
+    "semantic_scholar": lambda days: days * 4,
+}
+
+
+def load_profiles(paths):
+    """{profile name (file stem): validated config}, in the order given."""
+    profiles = {}
+    for path in paths:
+        name = Path(path).stem
+        if name in profiles:
+            raise ValueError(f"two profiles are named {name!r}; rename one of the files")
+        # One snapshot per profile, or they would keep replacing each other
+        profiles[name] = load_config(path, SNAPSHOT_PATH.with_name(f"config-{name}.json"))
+    return profiles
+
+
+def union_config(configs):
+    """A config asking every query of `configs` once, in first-seen order, over the longest window."""
+    configs = list(configs)
+    union = copy.deepcopy(configs[0])
+    for key in QUERY_LISTS:
+        union[key] = list(dict.fromkeys(value for cfg in configs for value in cfg[key]))
+    union["tracked_authors"] = {name: author_id for cfg in configs
+                                for name, author_id in cfg["tracked_authors"].items()}
+    union["days_lookback"] = max(cfg["days_lookback"] for cfg in configs)
+    return union
+
+
+def profile_queries(cfg):
+    """{source: [query]} a run under `cfg` alone would send, named as FetchState.record logs them."""
+    return {
+        "arxiv": list(cfg["arxiv_keywords"]),
+        "semantic_scholar": list(cfg["s2_keywords"]) + [f"author:{name}" for name in cfg["tracked_authors"]],
+        "hackernews": list(cfg["hn_keywords"]),
+        "reddit": list(cfg["reddit_keywords"]),
+        "bluesky": list(cfg["bluesky_keywords"]) + [f"handle:{handle}" for handle in cfg["bluesky_handles"]],
+    }
+
+
+def merge_windows(windows):
+    """One previous window from several profiles' latest.json, each item once."""
+    merged = {}
+    for window in windows:
+        for source in RANKED_SOURCES:
+            items = merged.setdefault(source, {})
+            for item in window.get(source) or []:
+                items.setdefault(item.get("id"), item)
+    return {source: list(items.values()) for source, items in merged.items()}
+
+
+def _in_scope(source, item, cfg, cutoffs):
+    if source == "arxiv" and not set(item.get("categories") or []) & set(cfg["arxiv_categories"]):
+        return False
+    if source == "reddit" and item.get("subreddit") not in cfg["reddit_subreddits"]:
+        return False
+    if (item.get("matched_keyword") or "").startswith("author:"):
+        return True  # tracked authors have a fixed window of their own
+    published = item.get("published") or ""
+    # Year-only dates (some S2 papers) cannot be placed in the window
+    return len(published) < 10 or published[:10] >= cutoffs[source]
+
+
+def select_items(fetched, hits, cfg, previous, now=None):
+    """One profile's share of a union fetch, as {source: items} (deep copies).
+
+    A freshly fetched item is kept if one of the profile's own queries
+    returned it, within its arXiv categories, subreddits and lookback; its
+    `matched_keyword` becomes the profile's first such query. An item
+    carried over from an earlier run is kept, as the profile last wrote
+    it, if it is in the profile's `previous` latest.json.
+    """
+    now = now or datetime.now()
+    queries = profile_queries(cfg)
+    cutoffs = {source: (now - timedelta(days=WINDOWS.get(source, int)(cfg["days_lookback"])))
+               .strftime("%Y-%m-%d") for source in RANKED_SOURCES}
+    selected = {}
+    for source in RANKED_SOURCES:
+        returned = hits.get(source, {})
+        own = {item.get("id"): item for item in previous.get(source) or []}
+        wanted = set(queries[source])
+        kept = []
+        for item in fetched.get(source) or []:
+            logged = returned.get(item["id"], ())
+            # arXiv logs its matches best first (title before abstract), as fetch_arxiv picks
+            order = logged if source == "arxiv" else queries[source]
+            matched = next((q for q in order if q in wanted and q in logged), None)
+            if matched is None:
+                carried = own.get(item["id"])
+                if carried and _in_scope(source, carried, cfg, cutoffs):
+                    kept.append(copy.deepcopy(carried))
+                continue
+            item = copy.deepcopy(item)
+            item["matched_keyword"] = matched
+            if _in_scope(source, item, cfg, cutoffs):
+                kept.append(item)
+        selected[source] = kept
+    return selected
+
+
+def read_json(path):
+    """A JSON file's contents (a profile's latest.json, the marks), or {} if unreadable."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
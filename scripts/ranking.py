@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Relevance ranking for Research Radar.
+Every paper and discussion gets one `relevance` score (0-100) so the
+combined feed has a common order, whatever each fetcher sorted by. The
+score mixes configured-keyword hits (title hits count double), recency,
+engagement (discussions: percentile within their own source; papers:
+citations) and tracked authors.
+Each component is computed as a column over all items at once; the
+dashboard gets the ordinals of the best TOP_K in the manifest. Scores
+decay with time, so the archive store does not keep them.
+"""
+
+import heapq
+import math
+from datetime import datetime
+
+from keyword_matcher import compile_keywords
+from search_index import INDEXED_SOURCES
+
+RANKED_SOURCES = ["arxiv", "semantic_scholar", "hackernews", "reddit", "bluesky"]
+KEYWORD_LISTS = ["arxiv_keywords", "s2_keywords", "hn_keywords", "reddit_keywords", "bluesky_keywords"]
+
+# Component weights (they sum to 1, so scores are 0-100)
+WEIGHTS = {"keywords": 0.4, "recency": 0.25, "engagement": 0.2, "author": 0.15}
+TITLE_HIT_WEIGHT = 2
+KEYWORD_SATURATION = 4        # weighted hits at which the keyword component maxes out
+RECENCY_HALF_LIFE_DAYS = 3
+CITATION_SATURATION = 100     # citations at which the citation component maxes out
+TOP_K = 50
+
+# Engagement per discussion source, compared only within that source
+ENGAGEMENT = {
+    "hackernews": lambda item: (item.get("points") or 0) + (item.get("comments") or 0),
+    "reddit": lambda item: (item.get("score") or 0) + (item.get("comments") or 0),
+    "bluesky": lambda item: (item.get("likes") or 0) + 2 * (item.get("reposts") or 0),
+}
+
+
+def _name_key(name):
+    """'Shneiderman, Ben' and 'Ben Shneiderman' both become ('ben', 'shneiderman')."""
+    return tuple(sorted(name.replace(",", " ").replace(".", " ").lower().split()))
+
+
+def keyword_column(items, keywords):
+    """Weighted count of distinct keywords in each item's title and summary, capped at 1."""
+    matcher = compile_keywords(keywords)
+    column = []
+    for item in items:
+        in_title = matcher.matched(item.get("title") or "")
+        in_summary = matcher.matched(item.get("summary") or "")
+        hits = TITLE_HIT_WEIGHT * len(in_title) + len(set(in_summary) - set(in_title))
+        column.append(min(1.0, hits / KEYWORD_SATURATION))
+    return column
+
+
+def recency_column(items, now):
+    """Exponential decay on age in days; undated or year-only items get 0.5."""
+    column = []
+    for item in items:
+        try:
+            published = datetime.fromisoformat((item.get("published") or "")[:10])
+        except ValueError:
+            column.append(0.5)
+            continue
+        age = max(0.0, (now - published).total_seconds() / 86400)
+        column.append(0.5 ** (age / RECENCY_HALF_LIFE_DAYS))
+    return column
+
+
+def engagement_column(items):
+    """Discussions: engagement percentile within their source (ties share one).
+
+    Papers have no such counts, so they get log(1 + citations), scaled so
+    CITATION_SATURATION citations give 1.
+    """
+    scale = math.log1p(CITATION_SATURATION)
+    column = [0.0] * len(items)
+    by_source = {}
+    for i, item in enumerate(items):
+        metric = ENGAGEMENT.get(item.get("source"))
+        if metric:
+            by_source.setdefault(item["source"], []).append((metric(item), i))
+        else:
+            column[i] = min(1.0, math.log1p(item.get("citations") or 0) / scale)
+    for values in by_source.values():
+        values.sort()
+        last = len(values) - 1
+        start = 0
+        while start <= last:
+            end = start
+            while end < last and values[end + 1][0] == values[start][0]:
+                end += 1
+            percentile = (start + end) / 2 / last if last else 0.5
+            for _, i in values[start:end + 1]:
+                column[i] = percentile
+            start = end + 1
+    return column
+
+
+def author_column(items, tracked_authors, tracked_handles):
+    """1 for items by a tracked author or Bluesky handle, else 0."""
+    names = {_name_key(name) for name in tracked_authors}
+    handles = set(tracked_handles)
+    column = []
+    for item in items:
+        keyword = item.get("matched_keyword") or ""
+        tracked = (keyword.startswith(("author:", "handle:"))
+                   or any(_name_key(a) in names for a in item.get("authors") or [])
+                   or bool(handles.intersection(item.get("authors") or [])))
+        column.append(1.0 if tracked else 0.0)
+    return column
+
+
+def score_items(all_data, cfg, now=None):
+    """Set `relevance` on every item of RANKED_SOURCES; returns how many were scored."""
+    items = [item for source in RANKED_SOURCES for item in all_data.get(source) or []]
+    if not items:
+        return 0
+    if now is None:
+        fetched_at = (all_data.get("meta") or {}).get("fetched_at")
+        now = datetime.fromisoformat(fetched_at) if fetched_at else datetime.now()
+
+    keywords = [kw for key in KEYWORD_LISTS for kw in cfg.get(key, [])]
+    columns = {
+        "keywords": keyword_column(items, keywords),
+        "recency": recency_column(items, now),
+        "engagement": engagement_column(items),
+        "author": author_column(items, cfg.get("tracked_authors", {}), cfg.get("bluesky_handles", [])),
+    }
+    weighted = [[WEIGHTS[name] * value for value in column] for name, column in columns.items()]
+    for item, parts in zip(items, zip(*weighted)):
+        item["relevance"] = round(100 * sum(parts), 1)
+    return len(items)
+
+
+def top_items(all_data, k=TOP_K):
+    """Ordinals (as in the search index) of the k highest-scoring items, best first."""
+    scored = []
+    ordinal = 0
+    for source in INDEXED_SOURCES:
+        for item in all_data.get(source) or []:
+            if "relevance" in item:
+                scored.append((item["relevance"], -ordinal))
+            ordinal += 1
+    return [-neg for _, neg in heapq.nlargest(k, scored)]
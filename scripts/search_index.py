@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Prebuilt inverted index for the dashboard's search box.
+Every token of an item's title, summary, authors, matched keyword and
+subreddit maps to the ordinals of the items containing it, so the page
+intersects a few posting lists instead of re-scanning every item.
+"""
+
+import re
+
+# Same order the dashboard concatenates sections into `allItems`
+INDEXED_SOURCES = ["arxiv", "semantic_scholar", "hackernews", "reddit", "bluesky", "faculty_jobs"]
+
+TOKEN_RE = re.compile(r"[^\W_]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in",
+    "is", "it", "its", "of", "on", "or", "that", "the", "this", "to", "was", "we", "were",
+    "which", "with",
+}
+
+
+def tokenize(text):
+    """Lower-cased word tokens of `text`, without stopwords and single letters."""
+    return [t for t in TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+def item_text(item):
+    """The fields the dashboard searches, joined."""
+    return " ".join([
+        item.get("title") or "",
+        item.get("matched_keyword") or "",
+        " ".join(item.get("authors") or []),
+        item.get("summary") or "",
+        item.get("subreddit") or "",
+    ])
+
+
+def build_index(all_data):
+    """Build {"sources": [[source, count]], "tokens": {token: postings}}.
+
+    An item's ordinal is its position across INDEXED_SOURCES in order.
+    Postings are sorted ordinals stored as gaps (first value, then deltas).
+    """
+    postings = {}
+    sources = []
+    ordinal = 0
+    for source in INDEXED_SOURCES:
+        items = all_data.get(source) or []
+        sources.append([source, len(items)])
+        for item in items:
+            for token in set(tokenize(item_text(item))):
+                postings.setdefault(token, []).append(ordinal)
+            ordinal += 1
+
+    tokens = {}
+    for token in sorted(postings):
+        ordinals = postings[token]
+        tokens[token] = [ordinals[0]] + [b - a for a, b in zip(ordinals, ordinals[1:])]
+    return {"sources": sources, "tokens": tokens}
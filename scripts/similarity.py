@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+"More like this" over the whole archive, without embeddings.
+Each archive item (title + summary) becomes a hashed bag-of-words vector:
+tokens are hashed into DIM buckets with sublinear term counts, stored
+sparse in flat binary files under .cache/similarity/ next to the archive
+store (gitignored). Rows follow the archive store's item ordinals, so new
+runs only append rows for new items; the inverted postings beside them
+are rewritten once per run that adds rows. Queries memory-map both,
+look up only their own buckets' postings, weight them by IDF and rank by
+cosine similarity; every run's items get their top-5 neighbors
+precomputed into docs/data/related.json for the dashboard.
+
+Usage:
+  python scripts/similarity.py build [--rebuild]
+  python scripts/similarity.py like arxiv:2403.01234      # an archive item key
+  python scripts/similarity.py like "agent failure taxonomy"
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import math
+import mmap
+import os
+import zlib
+from array import array
+from collections import Counter
+from pathlib import Path
+
+from archive_store import STORE_PATH, ArchiveStore, item_key
+from dedup import normalize_title
+from enrich import TERM_STOPWORDS
+from ranking import RANKED_SOURCES
+from search_index import INDEXED_SOURCES, tokenize
+
+INDEX_VERSION = 2
+DIM = 1 << 20             # hash buckets; sparse, so only collisions cost anything
+NEIGHBORS = 5
+MIN_SIMILARITY = 0.1      # weaker matches are not worth showing
+# Buckets in more items than this are near-stopwords with a low IDF; queries
+# skip them instead of walking their long posting lists
+MAX_POSTINGS = 2000
+
+# Row i of the index is archive item i: its buckets in `.idx` (uint32),
+# weights in `.val` (float32), and row start offsets in `.off` (uint64, n + 1)
+FILES = {"idx": "I", "val": "f", "off": "Q"}
+# The same rows inverted by bucket: the distinct buckets in `.bkt` (uint32,
+# sorted), each one's first posting in `.ptr` (uint64, buckets + 1), and per
+# posting its row (`.row`, uint32) and IDF-weighted, row-normalized value
+# (`.val`, float32), rows ascending within a bucket
+POSTING_FILES = {"bkt": "I", "ptr": "Q", "row": "I", "val": "f"}
+
+
+def item_vector(item):
+    """{bucket: 1 + log(count)} for an item's title (counted twice) and summary."""
+    title = item.get("title") or ""
+    tokens = tokenize(f"{title} {title} {item.get('summary') or ''}")
+    counts = Counter(zlib.crc32(t.encode("utf-8")) % DIM for t in tokens
+                     if t not in TERM_STOPWORDS and not t.isdigit())
+    return {bucket: 1 + math.log(count) for bucket, count in counts.items()}
+
+
+def index_dir(store_path=STORE_PATH):
+    """Index directory of an archive store file, kept beside it so temp data dirs take it along."""
+    return Path(store_path).parent / ".cache" / "similarity"
+
+
+def idf(rows, df):
+    return math.log((1 + rows) / (1 + df)) + 1
+
+
+def _mapped(path, typecode):
+    """Read-only typed view of a binary file (empty files cannot be mapped)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return array(typecode)
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast(typecode)
+
+
+class SimilarityIndex:
+    """Append-only sparse vectors for the archive store's items, in store order."""
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.keys = []
+        self._postings = None
+        meta_path = self.directory / "keys.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            meta = {}
+        if (meta.get("version") == INDEX_VERSION and meta.get("dim") == DIM
+                and all(self.path(ext).exists() for ext in FILES)
+                and all(self.path(ext, "postings").exists() for ext in POSTING_FILES)):
+            self.keys = meta["keys"]
+
+    def path(self, ext, name="vectors"):
+        return self.directory / f"{name}.{ext}"
+
+    def _map(self, name, files):
+        return {ext: _mapped(self.path(ext, name), code) for ext, code in files.items()}
+
+    def matches(self, store):
+        """True if every indexed row is still the store's item at that ordinal."""
+        return (len(self.keys) <= len(store.items)
+                and all(key == store.items[i]["key"] for i, key in enumerate(self.keys)))
+
+    def update(self, store, rebuild=False):
+        """Append rows for store items not indexed yet; returns how many."""
+        if rebuild or not self.matches(store):
+            self.keys = []
+        start = len(self.keys)
+        added = store.items[start:]
+        if not added and start:
+            return 0
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._postings = None
+        mode = "ab" if start else "wb"
+        offset = (os.path.getsize(self.path("idx")) // 4) if start else 0
+        buckets, weights, offsets = array("I"), array("f"), array("Q", [] if start else [0])
+        for entry in added:
+            vector = item_vector(entry["data"])
+            buckets.extend(vector)
+            weights.extend(vector.values())
+            offset += len(vector)
+            offsets.append(offset)
+        for ext, values in (("idx", buckets), ("val", weights), ("off", offsets)):
+            with open(self.path(ext), mode) as f:
+                values.tofile(f)
+
+        self.keys.extend(entry["key"] for entry in added)
+        self._write_postings()
+        meta_path = self.directory / "keys.json"
+        tmp = meta_path.with_name(".keys.json.tmp")
+        tmp.write_text(json.dumps({"version": INDEX_VERSION, "dim": DIM, "keys": self.keys},
+                                  ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, meta_path)
+        return len(added)
+
+    def _write_postings(self):
+        """Rewrite the postings files from the vectors.
+
+        A counting sort by bucket into flat arrays: memory is a few bytes
+        per stored value plus one counter per distinct bucket.
+        """
+        vectors = self._map("vectors", FILES)
+        idx, val, off = vectors["idx"], vectors["val"], vectors["off"]
+        rows = len(self.keys)
+        df = Counter(idx)
+        buckets = array("I", sorted(df))
+        ptr = array("Q", [0])
+        slot = {}
+        for bucket in buckets:
+            slot[bucket] = ptr[-1]
+            ptr.append(ptr[-1] + df[bucket])
+        weights = {bucket: idf(rows, n) for bucket, n in df.items()}
+        posting_rows = array("I", bytes(4 * len(idx)))
+        posting_vals = array("f", bytes(4 * len(idx)))
+        for row in range(rows):
+            weighted = [(idx[i], val[i] * weights[idx[i]]) for i in range(off[row], off[row + 1])]
+            norm = math.sqrt(sum(w * w for _, w in weighted)) or 1.0
+            for bucket, w in weighted:
+                i = slot[bucket]
+                slot[bucket] = i + 1
+                posting_rows[i] = row
+                posting_vals[i] = w / norm
+        del vectors, idx, val, off
+        for ext, values in (("bkt", buckets), ("ptr", ptr), ("row", posting_rows), ("val", posting_vals)):
+            path = self.path(ext, "postings")
+            tmp = path.with_name(f".{path.name}.tmp")
+            with open(tmp, "wb") as f:
+                values.tofile(f)
+            os.replace(tmp, path)
+
+    def query(self, vector, k=NEIGHBORS, exclude=()):
+        """[(row, cosine)] of the k rows most similar to a `item_vector`, best first."""
+        if not self.keys or not vector:
+            return []
+        if self._postings is None:
+            self._postings = self._map("postings", POSTING_FILES)
+        bkt, ptr = self._postings["bkt"], self._postings["ptr"]
+        posting_rows, posting_vals = self._postings["row"], self._postings["val"]
+        weighted = []  # (query weight, first posting, end)
+        for bucket, w in vector.items():
+            i = bisect.bisect_left(bkt, bucket)
+            if i < len(bkt) and bkt[i] == bucket:
+                start, end = ptr[i], ptr[i + 1]
+                weighted.append((w * idf(len(self.keys), end - start), start, end))
+        norm = math.sqrt(sum(w * w for w, _, _ in weighted)) or 1.0
+        scores = {}
+        for w, start, end in weighted:
+            if end - start > MAX_POSTINGS:
+                continue
+            for row, v in zip(posting_rows[start:end], posting_vals[start:end]):
+                scores[row] = scores.get(row, 0.0) + w * v
+        best = heapq.nlargest(k + len(exclude), scores.items(), key=lambda kv: kv[1])
+        ranked = ((row, score / norm) for row, score in best if row not in exclude)
+        return [(row, s) for row, s in ranked if s >= MIN_SIMILARITY][:k]
+
+
+def related_items(store, all_data, index, k=NEIGHBORS):
+    """Top-k archive neighbors of this run's papers and discussions, for related.json.
+
+    Returns {"neighbors": {search-index ordinal: [[item, score]]},
+    "items": {item: {title, link, source, first_seen}}}. Neighbors that are
+    the item itself, or repeat a title already listed, are skipped.
+    """
+    index.update(store)
+    neighbors, items = {}, {}
+    ordinal = 0
+    for source in INDEXED_SOURCES:
+        for item in all_data.get(source) or []:
+            if source in RANKED_SOURCES:
+                own = store.ordinal(item_key(source, item))
+                titles = {normalize_title(item.get("title") or "")}
+                found = []
+                for row, score in index.query(item_vector(item), k + 5, exclude={own}):
+                    other = store.items[row]
+                    title = normalize_title(other["data"].get("title") or "")
+                    if title in titles:
+                        continue
+                    titles.add(title)
+                    found.append([row, round(score, 3)])
+                    if row not in items:
+                        data = other["data"]
+                        items[row] = {"title": data.get("title", ""), "link": data.get("link", ""),
+                                      "source": other["key"].split(":", 1)[0],
+                                      "first_seen": other["first_seen"]}
+                    if len(found) == k:
+                        break
+                if found:
+                    neighbors[ordinal] = found
+            ordinal += 1
+    return {"neighbors": neighbors, "items": items}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar similarity index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="index archive items not indexed yet")
+    build.add_argument("--rebuild", action="store_true", help="reindex every item")
+    like = sub.add_parser("like", help="archive items similar to an item key or some text")
+    like.add_argument("query", help="archive item key (e.g. arxiv:2403.01234) or free text")
+    like.add_argument("-n", type=int, default=10, help="how many to list")
+    parser.add_argument("--store", default=STORE_PATH, type=Path, help="archive store file")
+    args = parser.parse_args(argv)
+
+    store = ArchiveStore.load(args.store)
+    index = SimilarityIndex(index_dir(args.store))
+    added = index.update(store, rebuild=getattr(args, "rebuild", False))
+    if args.command == "build":
+        print(f"✓ {added} items indexed, {len(index.keys)} in {index.directory}")
+        return
+
+    own = store.ordinal(args.query)
+    item = store.items[own]["data"] if own is not None else {"title": args.query}
+    if own is not None:
+        print(f"🔎 Like: {item.get('title', '')}")
+    for row, score in index.query(item_vector(item), args.n, exclude={own}):
+        entry = store.items[row]
+        data = entry["data"]
+        print(f"  {score:.2f}  {entry['first_seen']}  {entry['key'].split(':', 1)[0]:<16} "
+              f"{data.get('title', '')[:80]}")
+        print(f"        {data.get('link', '')}")
+
+
+if __name__ == "__main__":
+    main()
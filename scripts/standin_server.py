@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the APIs Research Radar fetches from.
+With http_client routed here (fetch_all.py --standin URL), every request
+is answered from recorded fixtures, or from synthetic payloads shaped
+like arXiv, Semantic Scholar, Algolia, Reddit, Bluesky, drafty and the
+GitHub job wikis. Latency and 429 answers can be injected to exercise
+the client's pooling, rate limiting and retries without any network.
+
+Usage:
+  python scripts/standin_server.py --port 8765 --latency 0.05 --rate-429 0.1
+  python scripts/standin_server.py --fixtures benchmarks/fixtures
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import http_client
+
+SYNTHETIC_ITEMS = 50
+
+_WORDS = (
+    "agent agents language model models human ai interaction collaboration llm reasoning "
+    "evaluation benchmark interface design study user users learning interactive systems "
+    "visualization trust explanation tool tools workflow creative writing code generation "
+    "multimodal alignment feedback crowdsourcing accessibility education planning memory"
+).split()
+_INSTITUTIONS = ["Stanford University", "Carnegie Mellon University", "University of Washington",
+                 "National University of Singapore", "HKUST", "University of Melbourne",
+                 "Georgia Tech", "University of Toronto", "ETH Zurich", "UC Berkeley"]
+_AREAS = ["Human-Computer Interaction", "Machine Learning", "Natural Language Processing",
+          "Software Engineering", "Data Science", "Theory", "Systems"]
+
+
+# ─── Synthetic payloads ──────────────────────────────────────────────────────
+
+def _rng(url, body=None):
+    return random.Random(hashlib.sha1(url.encode("utf-8") + (body or b"")).digest())
+
+
+def _title(rng, phrase=""):
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(5, 11))]
+    if phrase:
+        words.insert(rng.randint(0, len(words)), phrase)
+    return " ".join(words).capitalize()
+
+
+def _date(rng, i, step_hours=3):
+    return datetime.now() - timedelta(hours=i * step_hours + rng.random() * step_hours)
+
+
+def synthetic_arxiv(query, rng, items):
+    phrases = [p for p in query.get("search_query", [""])[0].split('"')[1::2]] or [""]
+    start = int(query.get("start", ["0"])[0])
+    count = max(0, min(int(query.get("max_results", ["10"])[0]), items - start))
+    entries = []
+    for i in range(start, start + count):
+        published = _date(rng, i).strftime("%Y-%m-%dT%H:%M:%SZ")
+        authors = "".join(f"<author><name>Author {rng.randint(1, 999)}</name></author>" for _ in range(3))
+        entries.append(
+            f"<entry><id>http://arxiv.org/abs/2601.{rng.randint(10000, 99999)}v1</id>"
+            f"<published>{published}</published><updated>{published}</updated>"
+            f"<title>{_title(rng, rng.choice(phrases))}</title>"
+            f"<summary>{' '.join(rng.choice(_WORDS) for _ in range(150))}</summary>{authors}"
+            f'<category term="cs.HC"/><category term="cs.AI"/></entry>'
+        )
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">'
+            + "".join(entries) + "</feed>"), "application/atom+xml"
+
+
+def _s2_paper(rng, paper_id=None, phrase=""):
+    return {
+        "paperId": paper_id or hashlib.sha1(str(rng.random()).encode()).hexdigest(),
+        "title": _title(rng, phrase),
+        "authors": [{"name": f"Author {rng.randint(1, 999)}"} for _ in range(4)],
+        "abstract": " ".join(rng.choice(_WORDS) for _ in range(120)),
+        "year": datetime.now().year,
+        "url": "https://www.semanticscholar.org/paper/x",
+        "publicationDate": _date(rng, rng.randint(0, 100)).strftime("%Y-%m-%d"),
+        "citationCount": rng.randint(0, 500),
+        "externalIds": {"ArXiv": f"2601.{rng.randint(10000, 99999)}"} if rng.random() < 0.3 else {},
+    }
+
+
+def synthetic_s2(path, query, body, rng, items):
+    if path.endswith("/paper/search"):
+        phrase = query.get("query", [""])[0]
+        count = min(items, int(query.get("limit", ["10"])[0]))
+        return {"total": items, "offset": 0, "data": [_s2_paper(rng, phrase=phrase) for _ in range(count)]}
+    ids = json.loads(body or b"{}").get("ids", [])
+    if path.endswith("/author/batch"):
+        return [{"authorId": author_id,
+                 "papers": [{"paperId": hashlib.sha1(f"{author_id}{i}".encode()).hexdigest(),
+                             "publicationDate": _date(rng, i, 48).strftime("%Y-%m-%d")}
+                            for i in range(20)]}
+                for author_id in ids]
+    if path.endswith("/paper/batch"):
+        return [_s2_paper(rng, paper_id) for paper_id in ids]
+    return None
+
+
+def _page(items, start, size):
+    """Positions [start, end) of one page over `items` synthetic results, and the next cursor."""
+    start = max(0, start)
+    end = max(start, min(items, start + size))
+    return range(start, end), (str(end) if end < items else None)
+
+
+def synthetic_hn(query, rng, items):
+    # tags=story,(story_1,story_2): current counts of known stories
+    story_ids = re.findall(r"story_(\w+)", query.get("tags", [""])[0])
+    if story_ids:
+        return {"hits": [{"objectID": hid, "points": rng.randint(1, 900), "num_comments": rng.randint(0, 400)}
+                         for hid in story_ids], "nbHits": len(story_ids), "page": 0, "nbPages": 1}
+    phrase = query.get("query", [""])[0]
+    per_page = int(query.get("hitsPerPage", ["20"])[0])
+    page = int(query.get("page", ["0"])[0])
+    # Honour numericFilters=created_at_i>N: results are 3 hours apart, newest first
+    since = re.search(r"created_at_i>(\d+)", query.get("numericFilters", [""])[0])
+    if since:
+        items = min(items, max(0, int((time.time() - int(since.group(1))) // (3 * 3600))))
+    positions, _ = _page(items, page * per_page, per_page)
+    hits = []
+    for i in positions:
+        created = _date(rng, i)
+        hits.append({"objectID": str(rng.randint(40000000, 49999999)), "title": _title(rng, phrase),
+                     "url": f"https://example.com/{rng.randint(1, 10**6)}", "points": rng.randint(1, 900),
+                     "num_comments": rng.randint(0, 400), "created_at": created.isoformat() + "Z",
+                     "created_at_i": int(created.timestamp())})
+    return {"hits": hits, "nbHits": items, "page": page, "nbPages": -(-items // max(1, per_page))}
+
+
+def synthetic_reddit(path, query, rng, items):
+    if path.startswith("/by_id/"):
+        names = path[len("/by_id/"):].removesuffix(".json").split(",")
+        return {"data": {"children": [{"data": {"id": name.removeprefix("t3_"), "score": rng.randint(0, 500),
+                                                "num_comments": rng.randint(0, 200)}}
+                                      for name in names]}}
+    subreddit = path.split("/")[2] if path.count("/") >= 2 else "all"
+    # Stand-in `after` cursors are "t3_<offset>", not a real post's fullname
+    start = int(query.get("after", ["t3_0"])[0].removeprefix("t3_") or 0)
+    positions, after = _page(items, start, int(query.get("limit", ["25"])[0]))
+    children = []
+    for i in positions:
+        created = _date(rng, i)
+        rid = "".join(rng.choice("abcdefghijklmnopqrstuvwxyz0123456789") for _ in range(7))
+        children.append({"data": {"id": rid, "title": _title(rng), "selftext": _title(rng),
+                                  "permalink": f"/r/{subreddit}/comments/{rid}/", "score": rng.randint(0, 500),
+                                  "num_comments": rng.randint(0, 200), "created_utc": created.timestamp()}})
+    return {"data": {"children": children, "after": after and f"t3_{after}"}}
+
+
+def _bsky_post(rng, i, handle=None, phrase=""):
+    handle = handle or f"user{rng.randint(1, 999)}.bsky.social"
+    return {"uri": f"at://did:plc:{rng.randint(10**8, 10**9)}/app.bsky.feed.post/{rng.randint(10**8, 10**9)}",
+            "author": {"handle": handle},
+            "record": {"text": _title(rng, phrase) + " " + _title(rng),
+                       "createdAt": _date(rng, i).isoformat() + "Z"},
+            "likeCount": rng.randint(0, 300), "repostCount": rng.randint(0, 80)}
+
+
+def synthetic_bluesky(path, query, rng, items):
+    start = int(query.get("cursor", ["0"])[0])
+    positions, cursor = _page(items, start, int(query.get("limit", ["10"])[0]))
+    page = {"cursor": cursor} if cursor else {}
+    if path.endswith("searchPosts"):
+        phrase = query.get("q", [""])[0]
+        return {"posts": [_bsky_post(rng, i, phrase=phrase) for i in positions], **page}
+    handle = query.get("actor", [""])[0]
+    return {"feed": [{"post": _bsky_post(rng, i, handle)} for i in positions], **page}
+
+
+def synthetic_drafty(rng, items):
+    rows = ["<tr><th>Institution</th><th>Area</th><th>Rank</th><th>Deadline</th></tr>"]
+    for i in range(items):
+        rows.append(
+            f'<tr class="row"><td><a href="https://jobs.example.edu/{i}">{rng.choice(_INSTITUTIONS)}</a></td>'
+            f"<td>{rng.choice(_AREAS)}</td><td>Assistant Professor</td>"
+            f"<td>{_date(rng, -i * 8).strftime('%Y-%m-%d')}</td></tr>"
+        )
+    return ("<html><head><title>CS Open Positions</title></head><body><table>"
+            + "\n".join(rows) + "</table></body></html>"), "text/html"
+
+
+def synthetic_wiki(rng, items):
+    lines = ["| University | Area | Rank | Deadline | Link |", "| --- | --- | --- | --- | --- |"]
+    for i in range(items):
+        lines.append(f"| {rng.choice(_INSTITUTIONS)} | {rng.choice(_AREAS)} | Assistant | "
+                     f"{_date(rng, -i * 8).strftime('%Y-%m-%d')} | [Apply](https://jobs.example.edu/{i}) |")
+    return "\n".join(lines), "text/markdown"
+
+
+def synthetic_response(method, url, body=None, items=SYNTHETIC_ITEMS):
+    """A made-up but well-formed answer for `url`, or None for unknown hosts."""
+    parts = urllib.parse.urlsplit(url)
+    query = urllib.parse.parse_qs(parts.query)
+    rng = _rng(url, body)
+    host = parts.hostname or ""
+
+    payload, content_type = None, "application/json"
+    if host == "export.arxiv.org":
+        payload, content_type = synthetic_arxiv(query, rng, items)
+    elif host == "api.semanticscholar.org":
+        payload = synthetic_s2(parts.path, query, body, rng, items)
+    elif host == "hn.algolia.com":
+        payload = synthetic_hn(query, rng, items)
+    elif host == "www.reddit.com":
+        payload = synthetic_reddit(parts.path, query, rng, items)
+    elif host == "public.api.bsky.app":
+        payload = synthetic_bluesky(parts.path, query, rng, items)
+    elif host == "drafty.cs.brown.edu":
+        payload, content_type = synthetic_drafty(rng, items)
+    elif host == "raw.githubusercontent.com":
+        payload, content_type = synthetic_wiki(rng, items)
+    if payload is None:
+        return None
+    if not isinstance(payload, str):
+        payload = json.dumps(payload)
+    return http_client.Response(url, 200, {"content-type": content_type}, payload.encode("utf-8"))
+
+
+# ─── Server ──────────────────────────────────────────────────────────────────
+
+class StandinServer:
+    """Threaded HTTP/1.1 server answering from a FixtureStore.
+
+    Each answer is delayed by `latency` seconds (plus up to `jitter`), and
+    a `rate_429` share of requests get "429 Too Many Requests" with a
+    Retry-After of `retry_after` seconds instead.
+    """
+
+    def __init__(self, store, host="127.0.0.1", port=0, latency=0.0, jitter=0.0,
+                 rate_429=0.0, retry_after=1, seed=0):
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.stats = {"requests": 0, "throttled": 0, "missing": 0}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _answer(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                url = self.headers.get(http_client.STANDIN_HEADER, "")
+                with server._lock:
+                    server.stats["requests"] += 1
+                    throttled = server._random.random() < server.rate_429
+                    server.stats["throttled"] += throttled
+                    delay = server.latency + server._random.random() * server.jitter
+                if delay:
+                    time.sleep(delay)
+
+                if throttled:
+                    self._reply(429, b"Too Many Requests", {"Retry-After": str(server.retry_after)})
+                    return
+                resp = server.store.load(self.command, url, body) if url else None
+                if resp is None:
+                    with server._lock:
+                        server.stats["missing"] += 1
+                    self._reply(404, b"no fixture for " + url.encode("utf-8"))
+                    return
+                headers = {k: v for k, v in resp.headers.items() if k.lower() != "connection"}
+                self._reply(resp.status, resp.body, headers)
+
+            def _reply(self, status, body, headers=None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = _answer
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def make_store(fixtures=None, items=SYNTHETIC_ITEMS):
+    """Fixture store for `fixtures` (if any) that synthesizes whatever is missing."""
+    fallback = lambda method, url, body: synthetic_response(method, url, body, items)
+    return http_client.FixtureStore(fixtures, "replay", fallback=fallback)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar stand-in API server")
+    parser.add_argument("--fixtures", help="recorded fixtures (fetch_all.py --record DIR)")
+    parser.add_argument("--items", type=int, default=SYNTHETIC_ITEMS,
+                        help="items per synthetic query, across its pages")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every answer")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="share of requests answered 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After sent with a 429")
+    args = parser.parse_args(argv)
+
+    server = StandinServer(make_store(args.fixtures, args.items), port=args.port, latency=args.latency,
+                           jitter=args.jitter, rate_429=args.rate_429, retry_after=args.retry_after)
+    print(f"🧪 Stand-in server on {server.url} (fetch_all.py --standin {server.url})")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Run telemetry for Research Radar.
+http_client records every request (DNS / connect / TLS / time to first
+byte / total, bytes, status, retries, cache use, rate-limit sleep) and
+the fetchers label them with their source and keyword, so the run report
+shows which source and which keyword the wall time went to. "sleep"
+counts rate-limit waits plus retry backoff. The same
+records can be exported as a Chrome trace (chrome://tracing, Perfetto).
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+PHASES = ("queued", "dns", "connect", "tls", "ttfb", "total")
+
+_labels = contextvars.ContextVar("telemetry_labels", default={})
+_lock = threading.Lock()
+_requests = []
+_spans = []
+_started = time.perf_counter()
+_started_at = datetime.now().isoformat()
+
+
+def reset():
+    """Forget everything recorded so far and restart the run clock."""
+    global _started, _started_at
+    with _lock:
+        _requests.clear()
+        _spans.clear()
+        _started = time.perf_counter()
+        _started_at = datetime.now().isoformat()
+
+
+def now():
+    """Seconds since the run clock started."""
+    return time.perf_counter() - _started
+
+
+@contextmanager
+def label(**labels):
+    """Attach labels (source, keyword, ...) to requests made inside the block."""
+    token = _labels.set({**_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+
+@contextmanager
+def span(name, **labels):
+    """Time a block as a named span; requests inside it carry its labels.
+
+    Yields a dict the caller may add fields to (e.g. the item count).
+    """
+    extra = {}
+    start = now()
+    with label(**labels):
+        try:
+            yield extra
+        finally:
+            record = {"name": name, "start": round(start, 4), "duration": round(now() - start, 4),
+                      "thread": threading.get_ident(), **_labels.get(), **extra}
+            with _lock:
+                _spans.append(record)
+
+
+def record_request(record):
+    """Store one request's measurements, tagged with the current labels."""
+    record = {**_labels.get(), **record, "thread": threading.get_ident()}
+    for key in PHASES + ("sleep", "backoff", "start"):
+        if key in record:
+            record[key] = round(record[key], 4)
+    with _lock:
+        _requests.append(record)
+
+
+def _summarize(records, key):
+    groups = {}
+    for r in records:
+        name = r.get(key)
+        if name is None:
+            continue
+        g = groups.setdefault(name, {"requests": 0, "errors": 0, "retries": 0, "cache_hits": 0,
+                                     "bytes": 0, "sleep": 0.0, "status": {},
+                                     **{phase: 0.0 for phase in PHASES}})
+        g["requests"] += 1
+        g["errors"] += 1 if r.get("error") else 0
+        g["retries"] += 1 if r.get("attempt", 1) > 1 else 0
+        g["cache_hits"] += 1 if r.get("cache") == "revalidated" else 0
+        g["bytes"] += r.get("bytes", 0)
+        g["sleep"] += r.get("sleep", 0.0) + r.get("backoff", 0.0)
+        status = str(r.get("status", "error"))
+        g["status"][status] = g["status"].get(status, 0) + 1
+        for phase in PHASES:
+            g[phase] += r.get(phase, 0.0)
+    for g in groups.values():
+        for field in ("sleep",) + PHASES:
+            g[field] = round(g[field], 3)
+    return dict(sorted(groups.items(), key=lambda kv: kv[1]["total"] + kv[1]["sleep"], reverse=True))
+
+
+def report():
+    """The run report: per-source, per-keyword and per-host totals plus every span and request."""
+    with _lock:
+        requests, spans = list(_requests), list(_spans)
+    sources = _summarize(requests, "source")
+    for s in spans:
+        if s.get("source") in sources and s["name"] == s["source"]:
+            sources[s["source"]]["wall"] = s["duration"]
+            if "items" in s:
+                sources[s["source"]]["items"] = s["items"]
+    return {
+        "started_at": _started_at,
+        "wall": round(now(), 3),
+        "sources": sources,
+        "keywords": _summarize(requests, "keyword"),
+        "hosts": _summarize(requests, "host"),
+        "spans": spans,
+        "requests": requests,
+    }
+
+
+def chrome_trace(data=None):
+    """Spans and requests as Chrome trace-event JSON (one row per thread)."""
+    data = data or report()
+    events = []
+    for s in data["spans"]:
+        events.append({"name": s["name"], "cat": "span", "ph": "X", "pid": os.getpid(),
+                       "tid": s["thread"], "ts": s["start"] * 1e6, "dur": s["duration"] * 1e6,
+                       "args": {k: v for k, v in s.items() if k not in ("name", "start", "duration", "thread")}})
+    for r in data["requests"]:
+        if "start" not in r:
+            continue
+        name = r.get("keyword") or r.get("host", "request")
+        events.append({"name": name, "cat": r.get("source", "request"), "ph": "X", "pid": os.getpid(),
+                       "tid": r["thread"], "ts": r["start"] * 1e6,
+                       "dur": (r.get("sleep", 0) + r.get("total", 0)) * 1e6,
+                       "args": {k: v for k, v in r.items() if k not in ("start", "thread")}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def _write(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(json.dumps(data, indent=1, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+def write_report(path, trace_path=None):
+    """Write the run report to `path` and, if given, a Chrome trace to `trace_path`."""
+    data = report()
+    _write(path, data)
+    if trace_path:
+        _write(trace_path, chrome_trace(data))
+    return data
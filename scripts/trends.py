@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Trend series for Research Radar, built from the archive store.
+Per run: items per source and per research keyword (papers and
+discussions only: a faculty job's matched_keyword is its region), new vs
+returning items, and how fast HN points / Reddit scores grow for items
+seen in consecutive runs.
+The aggregate in docs/data/trends.json carries the little state needed to
+extend it, so each update only reads the runs added since the last one.
+
+Usage:
+  python scripts/trends.py            # fold in new runs
+  python scripts/trends.py --rebuild  # recompute from every run
+"""
+
+import argparse
+import json
+import os
+import statistics
+from datetime import datetime
+from pathlib import Path
+
+from archive_store import ITEM_SOURCES, STORE_PATH, ArchiveStore
+from ranking import RANKED_SOURCES
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TRENDS_PATH = PROJECT_ROOT / "docs" / "data" / "trends.json"
+
+TRENDS_VERSION = 2
+# Engagement metric tracked for velocity, per source
+VELOCITY_METRICS = {"hackernews": "points", "reddit": "score"}
+TOP_MOVERS = 10
+
+
+def _hours_between(start, end):
+    delta = datetime.fromisoformat(end) - datetime.fromisoformat(start)
+    return delta.total_seconds() / 3600
+
+
+class Trends:
+    """Per-run series, all aligned with `runs` (one fetched_at per run).
+
+    - sources / keywords: {name: {"items": [n], "new": [n]}}
+      (returning = items - new)
+    - velocity: {source: [mean metric gain per hour among returning items, or None]}
+    - movers: {source: [...]}, fastest-growing items of the latest run
+    - state: `items_known` (archive items seen so far) and `last`
+      ({item key: [fetched_at, metric]} for items in the latest run)
+    """
+
+    def __init__(self, data=None):
+        data = data if data and data.get("version") == TRENDS_VERSION else {}
+        self.runs = data.get("runs", [])
+        self.sources = data.get("sources", {})
+        self.keywords = data.get("keywords", {})
+        self.velocity = data.get("velocity", {})
+        self.movers = data.get("movers", {})
+        state = data.get("state", {})
+        self.items_known = state.get("items_known", 0)
+        self.last = state.get("last", {})
+
+    @classmethod
+    def load(cls, path=TRENDS_PATH):
+        try:
+            return cls(json.loads(Path(path).read_text(encoding="utf-8")))
+        except (FileNotFoundError, ValueError):
+            return cls()
+
+    def to_dict(self):
+        return {
+            "version": TRENDS_VERSION,
+            "runs": self.runs,
+            "sources": self.sources,
+            "keywords": self.keywords,
+            "velocity": self.velocity,
+            "movers": self.movers,
+            "state": {"items_known": self.items_known, "last": self.last},
+        }
+
+    def save(self, path=TRENDS_PATH):
+        """Write the aggregate atomically, compact (the dashboard fetches it as is)."""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+
+    def matches(self, store):
+        """True if every run folded in so far is still the store's run at that index."""
+        return (len(self.runs) <= len(store.runs)
+                and all(run == store.runs[i]["fetched_at"] for i, run in enumerate(self.runs)))
+
+    def update(self, store):
+        """Fold in the store's runs that are not in the series yet; returns how many."""
+        start = len(self.runs)
+        for run_index in range(start, len(store.runs)):
+            self._add_run(store, run_index)
+        return len(store.runs) - start
+
+    def _series(self, table, name):
+        entry = table.setdefault(name, {"items": [], "new": []})
+        missing = len(self.runs) - len(entry["items"])
+        entry["items"].extend([0] * missing)
+        entry["new"].extend([0] * missing)
+        return entry
+
+    def _add_run(self, store, run_index):
+        run = store.runs[run_index]
+        fetched_at = run["fetched_at"]
+        known = self.items_known
+        self.runs.append(fetched_at)
+
+        last = {}
+        for source in ITEM_SOURCES:
+            ordinals = run["members"].get(source, [])
+            source_series = self._series(self.sources, source)
+            source_series["items"][-1] = len(ordinals)
+            source_series["new"][-1] = sum(1 for o in ordinals if o >= known)
+
+            metric = VELOCITY_METRICS.get(source)
+            rates, moves = [], []
+            for ordinal in ordinals:
+                item = store.item_at(ordinal, run_index)
+                keyword = item.get("matched_keyword") if source in RANKED_SOURCES else None
+                if keyword:
+                    kw_series = self._series(self.keywords, keyword)
+                    kw_series["items"][-1] += 1
+                    kw_series["new"][-1] += int(ordinal >= known)
+                if not metric:
+                    continue
+
+                key = store.items[ordinal]["key"]
+                value = item.get(metric) or 0
+                last[key] = [fetched_at, value]
+                if key not in self.last:
+                    continue
+                seen_at, seen_value = self.last[key]
+                hours = _hours_between(seen_at, fetched_at)
+                if hours <= 0:
+                    continue
+                rate = (value - seen_value) / hours
+                rates.append(rate)
+                moves.append({"id": item.get("id"), "title": item.get("title", ""),
+                              "link": item.get("link", ""), "gain": value - seen_value,
+                              "per_hour": round(rate, 2)})
+
+            if metric:
+                series = self.velocity.setdefault(source, [])
+                series.extend([None] * (len(self.runs) - 1 - len(series)))
+                series.append(round(statistics.fmean(rates), 2) if rates else None)
+                moves.sort(key=lambda m: m["per_hour"], reverse=True)
+                self.movers[source] = moves[:TOP_MOVERS]
+
+        # Sources or keywords absent from this run still get a 0 for it
+        for table in (self.sources, self.keywords):
+            for name in table:
+                self._series(table, name)
+        self.items_known = max([known] + [o + 1 for ords in run["members"].values() for o in ords])
+        self.last = last
+
+
+def update_trends(store, path=TRENDS_PATH, rebuild=False):
+    """Bring the trends file at `path` up to date with `store`.
+
+    The saved aggregate is reused unless `rebuild` is set or the store no
+    longer starts with the runs it was built from. Returns (trends, runs added).
+    """
+    trends = Trends.load(path)
+    if rebuild or not trends.matches(store):
+        trends = Trends()
+    added = trends.update(store)
+    trends.save(path)
+    return trends, added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Research Radar trend series")
+    parser.add_argument("--store", default=STORE_PATH, type=Path, help="archive store file")
+    parser.add_argument("-o", "--output", default=TRENDS_PATH, type=Path, help="trends file")
+    parser.add_argument("--rebuild", action="store_true", help="ignore the saved aggregate")
+    args = parser.parse_args(argv)
+
+    trends, added = update_trends(ArchiveStore.load(args.store), args.output, rebuild=args.rebuild)
+    print(f"✓ {added} new runs folded in, {len(trends.runs)} runs in {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Regression tests for scripts/dedup.py: titles never merge papers whose IDs differ."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from dedup import dedupe_papers, find_duplicates, jaccard, normalize_title, shingles  # noqa: E402
+
+
+def arxiv(arxiv_id, title):
+    return {"source": "arxiv", "id": f"{arxiv_id}v1", "title": title}
+
+
+def s2(paper_id, title, **ids):
+    return {"source": "semantic_scholar", "id": paper_id, "title": title, **ids}
+
+
+SHORT = "Human-AI Collaboration in Software Engineering"
+LONG = "Human-AI Collaboration in Software Engineering Education"
+
+
+def test_near_identical_titles_with_different_ids_stay_apart():
+    assert jaccard(shingles(normalize_title(SHORT)), shingles(normalize_title(LONG))) >= 0.8
+    assert sorted(find_duplicates([arxiv("2601.00001", SHORT), arxiv("2601.00002", LONG)])) == [[0], [1]]
+    assert sorted(find_duplicates([s2("a", SHORT, doi="10.1/one"), s2("b", LONG, doi="10.1/two")])) == [[0], [1]]
+
+
+def test_near_identical_titles_pair_each_paper_with_its_own_record():
+    # An arXiv record and a DOI-only S2 record share no ID kind, so titles decide
+    items = [arxiv("2601.00001", SHORT), arxiv("2601.00002", LONG),
+             s2("a", SHORT, doi="10.1/one"), s2("b", LONG, doi="10.1/two")]
+    assert sorted(find_duplicates(items)) == [[0, 2], [1, 3]]
+
+
+def test_same_title_with_different_ids_stays_apart():
+    items = [arxiv("2601.00001", "Position Paper"), arxiv("2601.00002", "Position Paper")]
+    assert sorted(find_duplicates(items)) == [[0], [1]]
+    items = [s2("a", "Position Paper", doi="10.1/one"), s2("b", "Position Paper", doi="10.1/two")]
+    assert sorted(find_duplicates(items)) == [[0], [1]]
+
+
+def test_no_transitive_merge_through_a_record_without_ids():
+    items = [arxiv("2601.00001", "Position Paper"), s2("a", "Position Paper"),
+             arxiv("2601.00002", "Position Paper")]
+    assert sorted(find_duplicates(items)) == [[0, 1], [2]]
+
+
+def test_title_still_merges_when_only_one_side_has_the_id():
+    items = [arxiv("2601.00001", "Agents at Work: A Field Study"),
+             s2("a", "Agents at work — a field study", doi="10.1/one")]
+    assert find_duplicates(items) == [[0, 1]]
+
+
+def test_shared_id_merges_despite_different_titles():
+    all_data = {"arxiv": [arxiv("2601.00001", "Agents at Work")],
+                "semantic_scholar": [s2("a", "Agents at Work (extended)", arxiv_id="2601.00001")]}
+    assert dedupe_papers(all_data) == 1
+    assert all_data["semantic_scholar"] == []
+    assert all_data["arxiv"][0]["also_seen"][0]["id"] == "a"